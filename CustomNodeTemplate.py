@@ -10,7 +10,14 @@ Date: [Date]
 Version: 1.0
 """
 
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, List, Optional, Union, NamedTuple, Mapping
+from types import MappingProxyType
+from collections import OrderedDict
+from dataclasses import dataclass, field
+import copy
+import hashlib
+import json
+import sys
 import numpy as np  # Common import for numerical operations
 
 # Core NeuroWorkflow imports - REQUIRED for all custom nodes
@@ -30,6 +37,193 @@ from neuroworkflow.core.port import PortType
 # import pandas as pd  # For data manipulation
 # import scipy.signal  # For signal processing
 
+# Numba import (optional - falls back to NumPy if not available)
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, boundscheck=False)
+    def _threshold_kernel(x, threshold):
+        """Zero out values not above threshold in a single fused pass (keeps x's dtype)."""
+        out = np.empty_like(x)
+        for i in range(x.shape[0]):
+            v = x[i]
+            out[i] = v if v > threshold else 0.0
+        return out
+
+    @njit(cache=True)
+    def _stats_kernel(x):
+        """Compute mean, sum of squared deviations, min and max in two passes."""
+        n = x.shape[0]
+        total = 0.0
+        lo = x[0]
+        hi = x[0]
+        for i in range(n):
+            v = x[i]
+            if v != v:
+                # NaN propagates to every statistic, as in NumPy
+                return np.nan, np.nan, np.nan, np.nan
+            total += v
+            if v < lo:
+                lo = v
+            if v > hi:
+                hi = v
+        mean = total / n
+        # Second pass over deviations avoids the cancellation of
+        # sum(x*x)/n - mean**2 for data far from zero (e.g. -65 mV)
+        m2 = 0.0
+        for i in range(n):
+            d = x[i] - mean
+            m2 += d * d
+        return mean, m2, lo, hi
+
+
+def _summary_statistics(data_array: np.ndarray) -> tuple:
+    """
+    Compute mean, std, min and max of an array in two passes.
+    
+    The std is taken from deviations about the mean rather than from the sum
+    of squares, so it stays accurate for data offset far from zero.
+    
+    Args:
+        data_array: Numerical array (any shape)
+        
+    Returns:
+        Tuple of (mean, std, min, max) as floats
+        
+    Raises:
+        ValueError: If the array is empty
+    """
+    if data_array.size == 0:
+        raise ValueError("zero-size array has no statistics")
+    
+    flat = np.ascontiguousarray(data_array, dtype=np.float64).ravel()
+    if NUMBA_AVAILABLE:
+        mean, m2, lo, hi = _stats_kernel(flat)
+    else:
+        mean = np.add.reduce(flat) / flat.shape[0]
+        deviations = flat - mean
+        m2 = np.dot(deviations, deviations)
+        lo = np.minimum.reduce(flat)
+        hi = np.maximum.reduce(flat)
+    
+    std = np.sqrt(m2 / flat.shape[0])
+    return float(mean), float(std), float(lo), float(hi)
+
+
+class StatsRecord(NamedTuple):
+    """Statistics of a single run, as read back from a StatsBuffer."""
+    mean: float
+    std: float
+    min: float
+    max: float
+    count: int
+
+
+@dataclass
+class StatsBuffer:
+    """
+    Column-oriented store of statistics across many node runs.
+    
+    Each statistic is kept in its own contiguous float64/int64 array so that
+    reductions over runs (e.g. ``buffer.mean.max()``) are a single vectorized
+    sweep. Attach one buffer to several nodes with ``attach_stats_buffer``.
+    """
+    capacity: int = 64
+    size: int = 0
+    _mean: np.ndarray = field(init=False, repr=False)
+    _std: np.ndarray = field(init=False, repr=False)
+    _min: np.ndarray = field(init=False, repr=False)
+    _max: np.ndarray = field(init=False, repr=False)
+    _count: np.ndarray = field(init=False, repr=False)
+    
+    def __post_init__(self):
+        self._mean = np.empty(self.capacity, dtype=np.float64)
+        self._std = np.empty(self.capacity, dtype=np.float64)
+        self._min = np.empty(self.capacity, dtype=np.float64)
+        self._max = np.empty(self.capacity, dtype=np.float64)
+        self._count = np.empty(self.capacity, dtype=np.int64)
+    
+    def append(self, mean: float, std: float, data_min: float, data_max: float, count: int) -> None:
+        """Append the statistics of one run, growing storage geometrically."""
+        if self.size == self.capacity:
+            self.capacity = max(1, self.capacity * 2)
+            self._mean = np.resize(self._mean, self.capacity)
+            self._std = np.resize(self._std, self.capacity)
+            self._min = np.resize(self._min, self.capacity)
+            self._max = np.resize(self._max, self.capacity)
+            self._count = np.resize(self._count, self.capacity)
+        i = self.size
+        self._mean[i] = mean
+        self._std[i] = std
+        self._min[i] = data_min
+        self._max[i] = data_max
+        self._count[i] = count
+        self.size += 1
+    
+    @property
+    def mean(self) -> np.ndarray:
+        return self._mean[:self.size]
+    
+    @property
+    def std(self) -> np.ndarray:
+        return self._std[:self.size]
+    
+    @property
+    def min(self) -> np.ndarray:
+        return self._min[:self.size]
+    
+    @property
+    def max(self) -> np.ndarray:
+        return self._max[:self.size]
+    
+    @property
+    def count(self) -> np.ndarray:
+        return self._count[:self.size]
+    
+    def __len__(self) -> int:
+        return self.size
+    
+    def __getitem__(self, index: int) -> StatsRecord:
+        """Return the statistics of one run as a record (AoS-style view)."""
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError(f"StatsBuffer index {index} out of range")
+        return StatsRecord(
+            float(self._mean[index]),
+            float(self._std[index]),
+            float(self._min[index]),
+            float(self._max[index]),
+            int(self._count[index]),
+        )
+
+
+def _hash_array(data: Any) -> Optional[bytes]:
+    """
+    Return a byte representation of input data suitable for cache keys.
+    
+    Data is converted with np.asarray and keyed by its type, dtype, shape and
+    raw buffer, so identical values produce identical keys. repr() is not
+    used: NumPy and pandas truncate the repr of large objects.
+    
+    Returns:
+        Key bytes, or None if the data has no reliable byte representation
+        (object arrays, e.g. ragged lists or mixed-type DataFrames)
+    """
+    try:
+        array = np.asarray(data)
+    except Exception:
+        return None
+    if array.dtype.hasobject:
+        return None
+    header = f"{type(data).__module__}.{type(data).__qualname__}|{array.dtype.str}|{array.shape}|"
+    return header.encode() + array.tobytes()
+
 
 class CustomNodeTemplate(Node):
     """
@@ -186,6 +380,22 @@ class CustomNodeTemplate(Node):
         }
     )
     
+    # Maximum number of process_data results kept per node
+    PROCESSING_CACHE_MAXSIZE = 32
+    
+    # Process steps as (step name, NODE_DEFINITION.methods key, enabling parameter)
+    _PROCESS_STEPS = (
+        ("validate_inputs", "validate_inputs", None),
+        ("process_data", "process_data", None),
+        ("calculate_statistics", "calculate_statistics", None),
+        ("generate_visualization", "generate_visualization", 'enable_plotting'),
+        ("save_results", "save_results", None),
+    )
+    
+    # Lazily imported plotting/data modules, shared by all instances
+    _plt = None
+    _pd = None
+    
     def __init__(self, name: str):
         """
         Initialize your custom node.
@@ -197,7 +407,13 @@ class CustomNodeTemplate(Node):
         super().__init__(name)
         
         # Initialize any additional instance variables here
-        self._processing_cache = {}
+        # Results of process_data keyed by a hash of parameters + inputs
+        # (least recently used evicted first)
+        self._processing_cache: "OrderedDict[str, Any]" = OrderedDict()
+        # (processed_data, key, statistics) of the last calculate_statistics call
+        self._statistics_cache: Optional[tuple] = None
+        # Optional shared buffer collecting statistics across runs
+        self._stats_buffer: Optional[StatsBuffer] = None
         self._validation_status = False
         
         # REQUIRED: Define the processing steps
@@ -210,38 +426,16 @@ class CustomNodeTemplate(Node):
         This method is REQUIRED and defines the order in which your
         node's methods will be executed.
         """
-        # Add process steps in the order they should be executed
-        self.add_process_step(
-            "validate_inputs",
-            self.validate_inputs,
-            method_key="validate_inputs"  # Links to NODE_DEFINITION.methods
-        )
-        
-        self.add_process_step(
-            "process_data",
-            self.process_data,
-            method_key="process_data"
-        )
-        
-        self.add_process_step(
-            "calculate_statistics",
-            self.calculate_statistics,
-            method_key="calculate_statistics"
-        )
-        
-        # Conditional step - only add if plotting is enabled
-        if self._parameters.get('enable_plotting', False):
-            self.add_process_step(
-                "generate_visualization",
-                self.generate_visualization,
-                method_key="generate_visualization"
-            )
-        
-        self.add_process_step(
-            "save_results",
-            self.save_results,
-            method_key="save_results"
-        )
+        # Add process steps in the order they should be executed.
+        # Conditional steps (e.g. visualization) are only added if their
+        # enabling parameter is set.
+        for step_name, method_key, enabled_by in self._PROCESS_STEPS:
+            if enabled_by is None or self._parameters.get(enabled_by, False):
+                self.add_process_step(
+                    step_name,
+                    getattr(self, step_name),
+                    method_key=method_key  # Links to NODE_DEFINITION.methods
+                )
     
     # ========================================================================
     # PROCESSING METHODS
@@ -320,6 +514,14 @@ class CustomNodeTemplate(Node):
         processing_mode = self._parameters['processing_mode']
         filter_freqs = self._parameters['filter_frequencies']
         
+        # Reuse the previous result when parameters and inputs are unchanged
+        # (a copy, so callers modifying it cannot corrupt the cache)
+        cache_key = self._processing_cache_key(input_data, sampling_rate)
+        if cache_key is not None and cache_key in self._processing_cache:
+            print(f"[{self.name}] Using cached result")
+            self._processing_cache.move_to_end(cache_key)
+            return {'processed_data': copy.deepcopy(self._processing_cache[cache_key])}
+        
         # Example processing logic
         if processing_mode == 'standard':
             processed_data = self._standard_processing(input_data, threshold)
@@ -330,8 +532,11 @@ class CustomNodeTemplate(Node):
         else:
             raise ValueError(f"Unknown processing mode: {processing_mode}")
         
-        # Store in cache for potential reuse
-        self._processing_cache['last_result'] = processed_data
+        # Store a copy in the cache for potential reuse
+        if cache_key is not None:
+            self._processing_cache[cache_key] = copy.deepcopy(processed_data)
+            while len(self._processing_cache) > self.PROCESSING_CACHE_MAXSIZE:
+                self._processing_cache.popitem(last=False)
         
         print(f"[{self.name}] Data processing completed")
         return {'processed_data': processed_data}
@@ -348,22 +553,41 @@ class CustomNodeTemplate(Node):
         """
         print(f"[{self.name}] Calculating statistics...")
         
+        # Statistics are deterministic, so the same object with the same
+        # parameters yields the same summary
+        stats_key = (id(processed_data), self._parameters['processing_mode'], self._parameters['threshold'])
+        if self._statistics_cache is not None:
+            cached_data, cached_key, cached_statistics = self._statistics_cache
+            if cached_data is processed_data and cached_key == stats_key:
+                print(f"[{self.name}] Using cached statistics")
+                if self._stats_buffer is not None and 'mean' in cached_statistics:
+                    self._stats_buffer.append(
+                        cached_statistics['mean'], cached_statistics['std'],
+                        cached_statistics['min'], cached_statistics['max'],
+                        cached_statistics['count'])
+                return {'statistics': cached_statistics}
+        
         # Example statistical calculations
         statistics = {}
         
         try:
             # Convert to numpy array if possible for easier statistics
             if hasattr(processed_data, '__iter__') and not isinstance(processed_data, str):
-                data_array = np.array(processed_data)
+                data_array = np.asarray(processed_data)
+                
+                mean, std, data_min, data_max = _summary_statistics(data_array)
                 
                 statistics.update({
-                    'mean': float(np.mean(data_array)),
-                    'std': float(np.std(data_array)),
-                    'min': float(np.min(data_array)),
-                    'max': float(np.max(data_array)),
+                    'mean': mean,
+                    'std': std,
+                    'min': data_min,
+                    'max': data_max,
                     'count': len(data_array),
                     'shape': data_array.shape if hasattr(data_array, 'shape') else None
                 })
+                
+                if self._stats_buffer is not None:
+                    self._stats_buffer.append(mean, std, data_min, data_max, len(data_array))
             else:
                 statistics['type'] = type(processed_data).__name__
                 statistics['value'] = str(processed_data)
@@ -376,6 +600,8 @@ class CustomNodeTemplate(Node):
         statistics['processing_mode'] = self._parameters['processing_mode']
         statistics['threshold_used'] = self._parameters['threshold']
         
+        self._statistics_cache = (processed_data, stats_key, statistics)
+        
         print(f"[{self.name}] Statistics calculation completed")
         return {'statistics': statistics}
     
@@ -394,34 +620,39 @@ class CustomNodeTemplate(Node):
         """
         print(f"[{self.name}] Generating visualization...")
         
+        # Nothing to plot for scalar or string data
+        if not (hasattr(processed_data, '__iter__') and not isinstance(processed_data, str)):
+            print(f"[{self.name}] Data is not plottable, skipping visualization")
+            return {'plot_figure': None}
+        
         try:
-            import matplotlib.pyplot as plt
-            
-            # Create a simple plot
-            fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(10, 8))
+            plt = self._get_pyplot()
             
-            # Plot 1: Data visualization
-            if hasattr(processed_data, '__iter__') and not isinstance(processed_data, str):
-                ax1.plot(processed_data)
-                ax1.set_title(f'Processed Data - {self.name}')
-                ax1.set_xlabel('Sample')
-                ax1.set_ylabel('Value')
-                ax1.grid(True)
+            # Only add the statistics panel when there is something to show
+            has_statistics = 'mean' in statistics
+            if has_statistics:
+                fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(10, 8))
             else:
-                ax1.text(0.5, 0.5, f'Data: {processed_data}', 
-                        ha='center', va='center', transform=ax1.transAxes)
-                ax1.set_title('Data Summary')
+                fig, ax1 = plt.subplots(1, 1, figsize=(10, 4))
+            
+            # Plot 1: Data visualization, decimated to roughly screen resolution
+            data_array = np.asarray(processed_data)
+            step = max(1, len(data_array) // 4000)
+            ax1.plot(np.arange(0, len(data_array), step), data_array[::step])
+            ax1.set_title(f'Processed Data - {self.name}')
+            ax1.set_xlabel('Sample')
+            ax1.set_ylabel('Value')
+            ax1.grid(True)
             
             # Plot 2: Statistics bar chart
-            if 'mean' in statistics:
-                stats_to_plot = ['mean', 'std', 'min', 'max']
-                values = [statistics.get(stat, 0) for stat in stats_to_plot]
+            if has_statistics:
+                # Only plot statistics that were actually computed
+                stats_to_plot = [stat for stat in ('mean', 'std', 'min', 'max') if stat in statistics]
+                values = np.fromiter((statistics[stat] for stat in stats_to_plot),
+                                     dtype=np.float64, count=len(stats_to_plot))
                 ax2.bar(stats_to_plot, values)
                 ax2.set_title('Statistics Summary')
                 ax2.set_ylabel('Value')
-            else:
-                ax2.text(0.5, 0.5, 'No numerical statistics available', 
-                        ha='center', va='center', transform=ax2.transAxes)
             
             plt.tight_layout()
             
@@ -451,8 +682,26 @@ class CustomNodeTemplate(Node):
         # Generate output filename
         output_file = f"{self.name}_results.csv"
         
+        # Fast path: numerical 1-D arrays are streamed straight to CSV and the
+        # scalar statistics go to a small JSON sidecar instead of being
+        # broadcast into one column per statistic
+        if (isinstance(processed_data, np.ndarray) and processed_data.ndim == 1
+                and processed_data.dtype.kind in 'biuf'):
+            try:
+                np.savetxt(output_file, processed_data, fmt='%.6g', delimiter=',',
+                           header='processed_data', comments='')
+                stats_file = f"{self.name}_stats.json"
+                with open(stats_file, 'w') as f:
+                    json.dump({key: value for key, value in statistics.items()
+                               if isinstance(value, (int, float, str, bool))}, f, indent=2)
+                print(f"[{self.name}] Results saved to {output_file} (statistics in {stats_file})")
+            except Exception as e:
+                print(f"[{self.name}] Error saving results: {e}")
+                output_file = None
+            return {'output_file': output_file}
+        
         try:
-            import pandas as pd
+            pd = self._get_pandas()
             
             # Create a DataFrame with results
             if hasattr(processed_data, '__iter__') and not isinstance(processed_data, str):
@@ -487,6 +736,71 @@ class CustomNodeTemplate(Node):
     # Add your own helper methods here
     # ========================================================================
     
+    @classmethod
+    def _get_pyplot(cls):
+        """
+        Import matplotlib.pyplot once, using the non-interactive Agg backend
+        unless pyplot was already set up by the caller (e.g. in a notebook).
+        
+        Returns:
+            The matplotlib.pyplot module
+            
+        Raises:
+            ImportError: If matplotlib is not installed
+        """
+        if cls._plt is None:
+            import matplotlib
+            if 'matplotlib.pyplot' not in sys.modules:
+                matplotlib.use('Agg')
+            import matplotlib.pyplot as plt
+            cls._plt = plt
+        return cls._plt
+    
+    @classmethod
+    def _get_pandas(cls):
+        """
+        Import pandas once.
+        
+        Returns:
+            The pandas module
+            
+        Raises:
+            ImportError: If pandas is not installed
+        """
+        if cls._pd is None:
+            import pandas as pd
+            cls._pd = pd
+        return cls._pd
+    
+    def _processing_cache_key(self, input_data: Any, sampling_rate: Optional[float]) -> Optional[str]:
+        """
+        Build the cache key for process_data.
+        
+        Args:
+            input_data: Input data to process
+            sampling_rate: Optional sampling rate
+            
+        Returns:
+            Hex digest identifying the parameters and inputs, or None if the
+            result must not be cached
+        """
+        # Debug output embeds the input object itself
+        if self._parameters['processing_mode'] == 'debug':
+            return None
+        data_bytes = _hash_array(input_data)
+        if data_bytes is None:
+            return None
+        
+        hasher = hashlib.blake2b(digest_size=16)
+        hasher.update(repr((
+            self._parameters['processing_mode'],
+            self._parameters['threshold'],
+            tuple(self._parameters['filter_frequencies']),
+            sampling_rate,
+        )).encode())
+        hasher.update(data_bytes)
+        return hasher.hexdigest()
+    
     def _standard_processing(self, data: Any, threshold: float) -> Any:
         """
         Standard processing implementation.
@@ -501,10 +815,13 @@ class CustomNodeTemplate(Node):
         # Example: Apply threshold to numerical data
         if hasattr(data, '__iter__') and not isinstance(data, str):
             try:
-                data_array = np.array(data)
-                # Apply threshold
-                processed = np.where(data_array > threshold, data_array, 0)
-                return processed.tolist()
+                data_array = np.asarray(data)
+                # Apply threshold, keeping the result as an ndarray
+                if NUMBA_AVAILABLE and data_array.ndim == 1 and data_array.dtype in (np.float32, np.float64):
+                    # Compare in the array's dtype, as np.where does with a Python float
+                    return _threshold_kernel(np.ascontiguousarray(data_array),
+                                             data_array.dtype.type(threshold))
+                return np.where(data_array > threshold, data_array, 0)
             except:
                 pass
         
@@ -564,25 +881,37 @@ class CustomNodeTemplate(Node):
         Args:
             **kwargs: Parameter name-value pairs
         """
+        known = {k: v for k, v in kwargs.items() if k in self._parameters}
+        self._parameters.update(known)
+        
         for param_name, value in kwargs.items():
-            if param_name in self._parameters:
-                self._parameters[param_name] = value
+            if param_name in known:
                 print(f"[{self.name}] Set {param_name} = {value}")
             else:
                 print(f"[{self.name}] Warning: Unknown parameter '{param_name}'")
     
-    def get_optimizable_parameters(self) -> Dict[str, Dict[str, Any]]:
+    def get_optimizable_parameters(self) -> Mapping[str, Dict[str, Any]]:
         """
         Get metadata about parameters that can be optimized.
         
         Returns:
-            Dictionary of optimizable parameter metadata
+            Read-only view of optimizable parameter metadata (do not mutate)
         """
-        return self._optimizable_parameters.copy()
+        return MappingProxyType(self._optimizable_parameters)
+    
+    def attach_stats_buffer(self, buffer: Optional[StatsBuffer]) -> None:
+        """
+        Attach a shared StatsBuffer that collects statistics from every run.
+        
+        Args:
+            buffer: Buffer to append to, or None to detach
+        """
+        self._stats_buffer = buffer
     
     def reset_cache(self) -> None:
         """Reset internal processing cache."""
         self._processing_cache.clear()
+        self._statistics_cache = None
         print(f"[{self.name}] Processing cache cleared")
     
     def get_processing_info(self) -> Dict[str, Any]:
@@ -590,13 +919,14 @@ class CustomNodeTemplate(Node):
         Get information about the node's processing state.
         
         Returns:
-            Dictionary with processing information
+            Dictionary with processing information; 'parameters' is a
+            read-only view of the live parameters (do not mutate)
         """
         return {
             'name': self.name,
             'type': self.__class__.NODE_DEFINITION.type,
             'description': self.description,
-            'parameters': self._parameters.copy(),
+            'parameters': MappingProxyType(self._parameters),
             'validation_status': self._validation_status,
             'cache_size': len(self._processing_cache),
             'input_ports': list(self._input_ports.keys()),
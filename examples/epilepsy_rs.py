@@ -5,8 +5,6 @@ Example from:
 '''
 import sys
 import os
-import numpy as np
-import matplotlib.pyplot as plt
 
 # Add the src directory to the Python path if needed
 src_path = os.path.abspath(os.path.join(os.getcwd(), '../src'))
@@ -18,8 +18,6 @@ Based on: epilepsy_rs_modified.py
 '''
 import sys
 import os
-import numpy as np
-import matplotlib.pyplot as plt
 
 # Add the src directory to the Python path if needed
 src_path = os.path.abspath(os.path.join(os.getcwd(), '../src'))
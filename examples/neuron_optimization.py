@@ -8,8 +8,6 @@ without creating cycles in the workflow graph, while respecting node encapsulati
 
 import sys
 import os
-import numpy as np
-import matplotlib.pyplot as plt
 from typing import Dict, Any
 
 # Add the src directory to the Python path to import the library
@@ -22,6 +20,59 @@ from neuroworkflow.nodes.stimulus.StimulusGeneratorNode import StimulusGenerator
 from neuroworkflow.nodes.network.NESTNeuronSetupNode import NESTNeuronSetupNode
 
 
+SIMULATION_TIME = 1000.0
+DT = 0.1
+
+
+def simulate_parameters(parameters: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """Build and run the neuron model from scratch with the given parameters.
+    
+    Module-level so JointOptimizationNode.run_grid_search can send it to
+    worker processes.
+    
+    Args:
+        parameters: Parameters grouped by node name
+        
+    Returns:
+        Simulation results of the simulation node
+    """
+    neuron_node = NESTNeuronSetupNode("neuron_node")
+    stimulus_node = StimulusGeneratorNode("stimulus_node")
+    simulation_node = NeuronSimulationNode("simulation_node")
+    
+    neuron_node.configure(**{
+        'nest_model': 'iaf_psc_alpha',
+        'threshold': -55.0,
+        'resting_potential': -70.0,
+        'time_constant': 20.0,
+        'refractory_period': 2.0,
+        **parameters.get(neuron_node.name, {})
+    })
+    stimulus_node.configure(**{
+        'stimulus_type': 'step',
+        'amplitude': 100.0,
+        'start_time': 250.0,
+        'end_time': 750.0,
+        **parameters.get(stimulus_node.name, {})
+    })
+    simulation_node.configure(dt=DT, simulation_time=SIMULATION_TIME)
+    stimulus_node.generate_stimulus(simulation_time=SIMULATION_TIME, dt=DT)
+    
+    workflow = (
+        WorkflowBuilder("grid_search_simulation")
+        .add_node(neuron_node)
+        .add_node(stimulus_node)
+        .add_node(simulation_node)
+        .connect("neuron_node", "nest_neuron", "simulation_node", "nest_neuron")
+        .connect("neuron_node", "nest_neuron_config", "simulation_node", "nest_neuron_config")
+        .connect("stimulus_node", "input_current", "simulation_node", "input_current")
+        .build()
+    )
+    if not workflow.execute():
+        return {}
+    return simulation_node.get_output('simulation_results')
+
+
 def main():
     """Run an encapsulated optimization workflow example."""
     # Create nodes
@@ -47,8 +98,8 @@ def main():
     )
     
     # Define simulation parameters (these are not node configuration parameters)
-    simulation_time = 1000.0
-    dt = 0.1
+    simulation_time = SIMULATION_TIME
+    dt = DT
     
     simulation_node.configure(
         dt=0.1,
@@ -171,16 +222,32 @@ def main():
         print(f"  {name}: {value}")
     print(f"Best error: {results['best_error']}")
     
+    # The same grid over the neuron parameters, evaluated in one call:
+    # every combination is simulated from scratch by simulate_parameters
+    print("\nRunning the grid search in one call...")
+    grid_node = JointOptimizationNode("grid_search_node")
+    grid_node.configure(grid_points=3)
+    grid_results = grid_node.run_grid_search(
+        simulate_parameters,
+        parameter_metadata=neuron_node.get_output('parameter_metadata'),
+        objective_target=objective_target
+    )
+    if 'error' in grid_results:
+        print(f"Grid search failed: {grid_results['error']}")
+    else:
+        print("Best parameters:")
+        for name, value in grid_results['best_parameters'].items():
+            print(f"  {name}: {value}")
+        print(f"Best error: {grid_results['best_error']}")
+    
     # Plot optimization history
     try:
+        import matplotlib.pyplot as plt
+        
         plt.figure(figsize=(10, 6))
         
         # Plot optimization history
-        history = results['history']
-        iterations = [h['iteration'] for h in history]
-        errors = [h['error'] for h in history]
-        
-        plt.plot(iterations, errors, 'o-')
+        plt.plot(results['iterations'], results['errors'], 'o-')
         plt.title('Encapsulated Optimization Progress')
         plt.xlabel('Iteration')
         plt.ylabel('Error')
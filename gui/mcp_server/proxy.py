@@ -5,6 +5,13 @@ import os
 
 from fastmcp import FastMCP, settings
 
+# orjson import (optional - faster config parsing)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Configuration via environment variables
 MCP_PROXY_PORT = int(os.environ.get("MCP_PROXY_PORT", 8001))
 
@@ -13,8 +20,8 @@ logging.basicConfig(level=logging.INFO)
 # logging.info("Remote MCP settings: %s", settings.model_dump_json(indent=2))
 
 # MCP設定ファイルをロード
-with open("mcp_config.json", encoding="utf-8") as fp:
-    mcp_config = json.load(fp)
+with open("mcp_config.json", "rb") as fp:
+    mcp_config = orjson.loads(fp.read()) if ORJSON_AVAILABLE else json.load(fp)
 
 # MCPプロキシ作成
 mcp = FastMCP.as_proxy(mcp_config, name="MCP Proxy")
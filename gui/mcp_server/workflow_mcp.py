@@ -1,10 +1,20 @@
+import asyncio
 import logging
 import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Any
 
 import httpx
 from fastmcp import FastMCP
 
+# orjson import (optional - faster encoding/decoding of large flow payloads)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
@@ -25,40 +35,76 @@ def _build_headers() -> dict[str, str]:
     return headers
 
 
-async def _make_get_request(url: str, timeout: float = 30.0) -> dict | None:
-    async with httpx.AsyncClient() as client:
-        try:
-            r = await client.get(url, headers=_build_headers(), timeout=timeout)
+# The token and user agent are read once from the environment, so the
+# headers never change for the lifetime of the process
+_HEADERS = _build_headers()
+
+
+# Shared client so every tool call reuses pooled keep-alive connections
+# instead of paying a TCP/TLS handshake per request
+_HTTP: httpx.AsyncClient | None = None
+_HTTP_LOCK = asyncio.Lock()
+
+
+async def _client() -> httpx.AsyncClient:
+    global _HTTP
+    if _HTTP is None:
+        async with _HTTP_LOCK:
+            if _HTTP is None:
+                _HTTP = httpx.AsyncClient(
+                    base_url=DJANGO_API_URL,
+                    headers=_HEADERS,
+                    timeout=httpx.Timeout(30.0, connect=5.0),
+                    limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+                )
+    return _HTTP
+
+
+async def _close_client() -> None:
+    global _HTTP
+    if _HTTP is not None:
+        await _HTTP.aclose()
+        _HTTP = None
+
+
+async def _make_request(method: str, url: str, payload: dict | None = None, timeout: float = 30.0) -> dict | None:
+    try:
+        client = await _client()
+        if ORJSON_AVAILABLE:
+            # Content-Type is already set on the shared client headers
+            content = orjson.dumps(payload) if payload is not None else None
+            r = await client.request(method, url, content=content, timeout=timeout)
             r.raise_for_status()
-            return r.json()
-        except Exception as e:
-            logger.error(f"GET request failed for {url}: {e}")
-            return None
+            return orjson.loads(r.content)
+        r = await client.request(method, url, json=payload, timeout=timeout)
+        r.raise_for_status()
+        return r.json()
+    except Exception as e:
+        logger.error(f"{method} request failed for {url}: {e}")
+        return None
+
+
+async def _make_get_request(url: str, timeout: float = 30.0) -> dict | None:
+    return await _make_request("GET", url, timeout=timeout)
 
 
 async def _make_post_request(url: str, payload: dict, timeout: float = 60.0) -> dict | None:
-    async with httpx.AsyncClient() as client:
-        try:
-            r = await client.post(url, headers=_build_headers(), json=payload, timeout=timeout)
-            r.raise_for_status()
-            return r.json()
-        except Exception as e:
-            logger.error(f"POST request failed for {url}: {e}")
-            return None
+    return await _make_request("POST", url, payload, timeout=timeout)
 
 
 async def _make_put_request(url: str, payload: dict, timeout: float = 30.0) -> dict | None:
-    async with httpx.AsyncClient() as client:
-        try:
-            r = await client.put(url, headers=_build_headers(), json=payload, timeout=timeout)
-            r.raise_for_status()
-            return r.json()
-        except Exception as e:
-            logger.error(f"PUT request failed for {url}: {e}")
-            return None
+    return await _make_request("PUT", url, payload, timeout=timeout)
 
 
-mcp = FastMCP("workflow")
+@asynccontextmanager
+async def _lifespan(server: FastMCP) -> AsyncIterator[None]:
+    try:
+        yield
+    finally:
+        await _close_client()
+
+
+mcp = FastMCP("workflow", lifespan=_lifespan)
 
 
 # Handlers (tools) using the FastMCP decorator if available
@@ -109,6 +155,21 @@ async def update_node_parameter(workflow_id: str, node_id: str, parameter_key: s
     return {"status": "success", "result": data}
 
 
+@mcp.tool()
+async def update_node_parameters_bulk(workflow_id: str, node_id: str, parameters: dict[str, Any], parameter_field: str = "value") -> dict[str, Any]:
+    """Update several node parameters in a single request via Django API."""
+    url = f"{DJANGO_API_URL}/{workflow_id}/nodes/{node_id}/parameters/bulk/"
+    payload = {
+        "updates": [
+            {"key": key, "value": value, "field": parameter_field}
+            for key, value in parameters.items()
+        ]
+    }
+    data = await _make_put_request(url, payload)
+    if data is None:
+        return {"status": "error", "error": f"Failed to update parameters {list(parameters)} for node {node_id}"}
+    return {"status": "success", "result": data}
+
 @mcp.tool()
 async def health() -> dict[str, Any]:
     """Health check of the Django backend (sample-flow endpoint)."""
@@ -1,9 +1,44 @@
-from rest_framework.decorators import api_view, permission_classes
+import hashlib
+from functools import wraps
+
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import quote_etag
+from rest_framework.decorators import api_view, authentication_classes, permission_classes
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.response import Response
 
 
+def user_conditional(view_func):
+    """Answer repeat GETs with 304 Not Modified while the user is unchanged.
+
+    Must be applied below @api_view: DRF authenticates inside the view, so
+    django.views.decorators.http.condition would only see AnonymousUser.
+    """
+
+    @wraps(view_func)
+    def wrapper(request, *args, **kwargs):
+        user = request.user
+        fingerprint = (
+            f"{user.pk}:{user.username}:{user.email}:{user.first_name}:"
+            f"{user.last_name}:{user.last_login}"
+        )
+        etag = quote_etag(hashlib.md5(fingerprint.encode()).hexdigest())
+
+        # ETag only: no timestamp changes when get_or_create_user rewrites the
+        # username or email, so If-Modified-Since could return stale data
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = view_func(request, *args, **kwargs)
+
+        response["ETag"] = etag
+        patch_vary_headers(response, ["Authorization"])
+        return response
+
+    return wrapper
+
+
 @api_view(["GET"])
+@authentication_classes([])  # no authenticator runs for health checks
 def health_check(request):
     """Authentication-free health checks"""
     return Response({"status": "ok", "message": "Django server is running"})
@@ -11,6 +46,7 @@ def health_check(request):
 
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
+@user_conditional
 def protected_view(request):
     """Endpoints that require authentication"""
     return Response(
@@ -28,21 +64,21 @@ def protected_view(request):
 
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
+@user_conditional
 def user_profile(request):
     """User information acquisition"""
+    user = request.user
     return Response(
         {
             "user": {
-                "id": request.user.id,
-                "username": request.user.username,
-                "email": request.user.email,
-                "first_name": request.user.first_name,
-                "last_name": request.user.last_name,
-                "date_joined": request.user.date_joined.isoformat(),
+                "id": user.id,
+                "username": user.username,
+                "email": user.email,
+                "first_name": user.first_name,
+                "last_name": user.last_name,
+                "date_joined": user.date_joined.isoformat(),
                 "last_login": (
-                    request.user.last_login.isoformat()
-                    if request.user.last_login
-                    else None
+                    user.last_login.isoformat() if user.last_login else None
                 ),
             }
         }
@@ -1,13 +1,342 @@
+import base64
+import binascii
+import hashlib
+import json
 import jwt
+import re
+import threading
+import time
 import requests
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import padding
+from cryptography.hazmat.primitives.asymmetric.rsa import RSAPrivateKey
+from requests.adapters import HTTPAdapter
 from django.contrib.auth.models import User
 from django.contrib.auth import get_user_model
-from rest_framework import authentication, exceptions
+from django.db.models import Case, Q, When
+from rest_framework import HTTP_HEADER_ENCODING, authentication, exceptions
 from django.conf import settings
+from django.core.cache import cache
 import logging
+from collections import OrderedDict
 
 logger = logging.getLogger(__name__)
 
+# orjson import (optional - faster JWKS and token payload decoding)
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# JWKS cache settings (seconds)
+JWKS_DEFAULT_TTL = 600  # used when the response has no Cache-Control max-age
+JWKS_MIN_REFRESH_INTERVAL = 30  # limits refetches triggered by unknown or expired kids
+JWKS_GRACE_PERIOD = 300  # keys dropped from the JWKS stay valid this long
+
+# Shared cache (django.core.cache, e.g. Redis) so gunicorn workers and
+# restarted workers reuse one JWKS fetch per rotation
+JWKS_SHARED_KEY_PREFIX = "jwks:"
+JWKS_SHARED_LOCK_KEY = "jwks:lock"
+JWKS_SHARED_LOCK_TIMEOUT = 5  # seconds a worker may hold the fetch lock
+JWKS_SHARED_LOCK_WAIT = 1.0  # seconds other workers wait for its result
+
+# kid -> (public key, expiry on the time.monotonic() clock)
+_JWKS_CACHE = {}
+_JWKS_LOCK = threading.Lock()
+_JWKS_LAST_FETCH = float("-inf")
+# Cleared while one thread fetches the JWKS; threads without a usable key
+# wait on it (outside _JWKS_LOCK) instead of fetching as well
+_JWKS_REFRESH_DONE = threading.Event()
+_JWKS_REFRESH_DONE.set()
+JWKS_REFRESH_WAIT = 4.0  # seconds a thread waits for another thread's refresh
+
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+
+# Shared session so JWKS refreshes reuse the keep-alive TLS connection; no
+# retries, a failed refresh keeps the cached keys and is retried after
+# JWKS_MIN_REFRESH_INTERVAL
+_HTTP = requests.Session()
+_HTTP.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
+# Validated tokens: blake2b(token) -> (user pk, expiry on the time.time() clock)
+TOKEN_CACHE_TTL = 60
+TOKEN_CACHE_MAXSIZE = 10_000
+_TOKEN_CACHE = OrderedDict()
+_TOKEN_CACHE_LOCK = threading.Lock()
+
+
+def _token_cache_key(token):
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+def _get_cached_user_pk(cache_key):
+    """
+    Return the user pk of a recently validated, unexpired token, or None
+    """
+    with _TOKEN_CACHE_LOCK:
+        entry = _TOKEN_CACHE.get(cache_key)
+        if entry is None:
+            return None
+        if entry[1] <= time.time():
+            del _TOKEN_CACHE[cache_key]
+            return None
+        _TOKEN_CACHE.move_to_end(cache_key)
+        return entry[0]
+
+
+def _cache_validated_token(cache_key, user_pk, payload):
+    """
+    Remember a validated token until its exp (at most TOKEN_CACHE_TTL seconds)
+    """
+    expires_at = time.time() + TOKEN_CACHE_TTL
+    if payload.get("exp") is not None:
+        expires_at = min(expires_at, float(payload["exp"]))
+    with _TOKEN_CACHE_LOCK:
+        _TOKEN_CACHE[cache_key] = (user_pk, expires_at)
+        _TOKEN_CACHE.move_to_end(cache_key)
+        while len(_TOKEN_CACHE) > TOKEN_CACHE_MAXSIZE:
+            _TOKEN_CACHE.popitem(last=False)
+
+
+def _b64url_decode(segment):
+    return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+
+def _split_token(token):
+    """
+    Split a compact JWS into (header, payload, signing input, signature)
+    """
+    if token.count(".") != 2:
+        raise jwt.DecodeError("Not enough segments")
+    try:
+        signing_input, _, signature_segment = token.rpartition(".")
+        header_segment, _, payload_segment = signing_input.partition(".")
+        header = _json_loads(_b64url_decode(header_segment))
+        payload = _json_loads(_b64url_decode(payload_segment))
+        signature = _b64url_decode(signature_segment)
+        signing_input = signing_input.encode("ascii")
+    except (ValueError, binascii.Error) as e:
+        raise jwt.DecodeError(f"Invalid token encoding: {e}")
+    if not isinstance(header, dict) or not isinstance(payload, dict):
+        raise jwt.DecodeError("Invalid token header or payload")
+    return header, payload, signing_input, signature
+
+
+def _decode_rs256(parts, public_key, audience, issuer):
+    """
+    Verify an RS256 token with the RSA key directly and validate its claims
+
+    parts is the result of _split_token. Raises the same PyJWT exceptions as
+    jwt.decode for the checks it performs (signature, exp, nbf, iat, aud, iss).
+    """
+    header, payload, signing_input, signature = parts
+    if header.get("alg") != "RS256":
+        raise jwt.InvalidAlgorithmError("The specified alg value is not allowed")
+
+    try:
+        public_key.verify(signature, signing_input, padding.PKCS1v15(), hashes.SHA256())
+    except InvalidSignature:
+        raise jwt.InvalidSignatureError("Signature verification failed")
+
+    now = time.time()
+    for claim in ("exp", "nbf", "iat"):
+        if claim in payload and not isinstance(payload[claim], (int, float)):
+            raise jwt.DecodeError(f"{claim} claim must be a number")
+    if "exp" in payload and payload["exp"] <= now:
+        raise jwt.ExpiredSignatureError("Signature has expired")
+    if "nbf" in payload and payload["nbf"] > now:
+        raise jwt.ImmatureSignatureError("The token is not yet valid (nbf)")
+    if "iat" in payload and payload["iat"] > now:
+        raise jwt.ImmatureSignatureError("The token is not yet valid (iat)")
+
+    if "aud" not in payload:
+        raise jwt.MissingRequiredClaimError("aud")
+    aud = payload["aud"]
+    if audience not in (aud if isinstance(aud, list) else [aud]):
+        raise jwt.InvalidAudienceError("Audience doesn't match")
+
+    if "iss" not in payload:
+        raise jwt.MissingRequiredClaimError("iss")
+    if payload["iss"] != issuer:
+        raise jwt.InvalidIssuerError("Invalid issuer")
+
+    return payload
+
+
+def _store_public_key(kid, jwk, expires_in):
+    """
+    Parse a JWK and keep it in the in-process cache (caller holds _JWKS_LOCK)
+
+    from_jwk already returns the cryptography key object, so it is cached
+    as-is; a JWK that carries private parameters is reduced to its public
+    half so verification always takes the direct RSAPublicKey path.
+    """
+    try:
+        public_key = jwt.algorithms.RSAAlgorithm.from_jwk(jwk)
+    except (ValueError, jwt.InvalidKeyError) as e:
+        logger.warning(f"Skipping unusable JWK {kid}: {e}")
+        return False
+    if isinstance(public_key, RSAPrivateKey):
+        public_key = public_key.public_key()
+    _JWKS_CACHE[kid] = (public_key, time.monotonic() + expires_in)
+    return True
+
+
+def _load_shared_key(kid):
+    """
+    Copy kid from the shared cache into the in-process cache (caller holds _JWKS_LOCK)
+    """
+    try:
+        entry = cache.get(f"{JWKS_SHARED_KEY_PREFIX}{kid}")
+    except Exception as e:
+        logger.warning(f"Shared JWKS cache unavailable: {e}")
+        return False
+    if not entry:
+        return False
+    expires_in = entry["expires_at"] - time.time()
+    return expires_in > 0 and _store_public_key(kid, entry["jwk"], expires_in)
+
+
+def _download_jwks(jwks_url, kid):
+    """
+    Fetch the JWKS from the endpoint (called without _JWKS_LOCK)
+
+    Only one worker fetches at a time (cache.add lock); the others wait
+    briefly for kid to show up in the shared cache before fetching themselves.
+
+    Returns:
+        (jwks, ttl), or None if kid arrived via the shared cache or the fetch failed
+    """
+    try:
+        holds_lock = cache.add(JWKS_SHARED_LOCK_KEY, 1, JWKS_SHARED_LOCK_TIMEOUT)
+    except Exception as e:
+        logger.warning(f"Shared JWKS cache unavailable: {e}")
+        holds_lock = True
+    if not holds_lock:
+        deadline = time.monotonic() + JWKS_SHARED_LOCK_WAIT
+        while time.monotonic() < deadline:
+            time.sleep(0.05)
+            with _JWKS_LOCK:
+                if _load_shared_key(kid):
+                    return None
+
+    try:
+        response = _HTTP.get(jwks_url, timeout=(1, 2))
+        response.raise_for_status()
+        jwks = _json_loads(response.content)
+    except (requests.RequestException, ValueError) as e:
+        logger.warning(f"JWKS fetch failed, keeping cached keys: {e}")
+        return None
+    finally:
+        if holds_lock:
+            try:
+                cache.delete(JWKS_SHARED_LOCK_KEY)
+            except Exception:
+                pass
+
+    match = _MAX_AGE_RE.search(response.headers.get("Cache-Control", ""))
+    ttl = int(match.group(1)) if match else JWKS_DEFAULT_TTL
+    return jwks, ttl
+
+
+def _publish_jwks(jwks, ttl):
+    """
+    Store a fetched JWKS in the in-process cache (caller holds _JWKS_LOCK)
+
+    Returns:
+        Entries for the shared cache, to be written after releasing the lock
+    """
+    now = time.monotonic()
+
+    # Keys rotated out of the JWKS keep validating in-flight tokens for a while
+    fetched = {key.get("kid") for key in jwks.get("keys", [])}
+    for kid, (public_key, expires_at) in list(_JWKS_CACHE.items()):
+        if kid not in fetched:
+            if expires_at + JWKS_GRACE_PERIOD > now:
+                _JWKS_CACHE[kid] = (public_key, min(expires_at, now + JWKS_GRACE_PERIOD))
+            else:
+                del _JWKS_CACHE[kid]
+
+    shared = {}
+    expires_at = time.time() + ttl
+    for key in jwks.get("keys", []):
+        kid = key.get("kid")
+        if kid and _store_public_key(kid, key, ttl):
+            shared[f"{JWKS_SHARED_KEY_PREFIX}{kid}"] = {"jwk": key, "expires_at": expires_at}
+    return shared
+
+
+def _refresh_jwks(jwks_url, kid):
+    """
+    Fetch the JWKS and store every key in both caches
+
+    _JWKS_LOCK is only held to publish the keys, so other threads keep
+    authenticating with cached keys while the endpoint is slow or down.
+    """
+    try:
+        fetched = _download_jwks(jwks_url, kid)
+        if fetched is None:
+            return
+        with _JWKS_LOCK:
+            shared = _publish_jwks(*fetched)
+        try:
+            cache.set_many(shared, timeout=fetched[1])
+        except Exception as e:
+            logger.warning(f"Shared JWKS cache unavailable: {e}")
+    finally:
+        _JWKS_REFRESH_DONE.set()
+
+
+def _get_public_key(jwks_url, kid):
+    """
+    Return the cached public key for kid, refreshing the JWKS on a miss or expiry
+
+    Lookup order: in-process cache, shared cache, then the JWKS endpoint.
+    """
+    global _JWKS_LAST_FETCH
+
+    entry = _JWKS_CACHE.get(kid)
+    now = time.monotonic()
+    if entry and entry[1] > now:
+        return entry[0]
+
+    # Refreshes (also for expired keys) run at most once per
+    # JWKS_MIN_REFRESH_INTERVAL; meanwhile an expired key inside its grace
+    # window is served without queueing on the lock
+    throttled = now - _JWKS_LAST_FETCH < JWKS_MIN_REFRESH_INTERVAL
+    if entry and throttled and entry[1] + JWKS_GRACE_PERIOD > now:
+        return entry[0]
+
+    with _JWKS_LOCK:
+        # Another thread may have refreshed while we waited for the lock
+        entry = _JWKS_CACHE.get(kid)
+        now = time.monotonic()
+        if entry and entry[1] > now:
+            return entry[0]
+
+        if _load_shared_key(kid):
+            return _JWKS_CACHE[kid][0]
+
+        # Claim the refresh under the lock so only this thread fetches
+        refresh = now - _JWKS_LAST_FETCH >= JWKS_MIN_REFRESH_INTERVAL
+        if refresh:
+            _JWKS_LAST_FETCH = now
+            _JWKS_REFRESH_DONE.clear()
+
+    if refresh:
+        _refresh_jwks(jwks_url, kid)
+    elif not (entry and entry[1] + JWKS_GRACE_PERIOD > now):
+        # No usable key yet: wait for a refresh already in flight, if any
+        _JWKS_REFRESH_DONE.wait(JWKS_REFRESH_WAIT)
+
+    entry = _JWKS_CACHE.get(kid)
+    if entry and entry[1] + JWKS_GRACE_PERIOD > time.monotonic():
+        # Expired but not yet past the grace window (refresh failed or throttled)
+        return entry[0]
+    return None
+
 
 class SupabaseAuthentication(authentication.BaseAuthentication):
     """
@@ -15,20 +344,31 @@ class SupabaseAuthentication(authentication.BaseAuthentication):
     """
 
     def authenticate(self, request):
-        auth_header = authentication.get_authorization_header(request).split()
-
-        if not auth_header or auth_header[0].lower() != b"bearer":
+        # Requests without an Authorization header return before any decoding
+        auth_header = request.META.get("HTTP_AUTHORIZATION")
+        if not auth_header:
+            return None
+        if isinstance(auth_header, str):
+            # Same encoding get_authorization_header applies
+            auth_header = auth_header.encode(HTTP_HEADER_ENCODING)
+
+        # Prefix check on the raw bytes; no list is built for other schemes
+        if auth_header[:6].lower() != b"bearer" or (
+            len(auth_header) > 6 and not auth_header[6:7].isspace()
+        ):
             return None
 
-        if len(auth_header) == 1:
+        credentials = auth_header[7:].strip()
+        if not credentials:
             msg = "Invalid token header. No credentials provided."
             raise exceptions.AuthenticationFailed(msg)
-        elif len(auth_header) > 2:
+        if b" " in credentials or b"\t" in credentials:
             msg = "Invalid token header. Token string should not contain spaces."
             raise exceptions.AuthenticationFailed(msg)
 
         try:
-            token = auth_header[1].decode("utf-8")
+            # JWTs are ASCII (base64url segments separated by dots)
+            token = credentials.decode("ascii")
         except UnicodeError:
             msg = "Invalid token header. Token string should not contain invalid characters."
             raise exceptions.AuthenticationFailed(msg)
@@ -39,6 +379,18 @@ class SupabaseAuthentication(authentication.BaseAuthentication):
         """
         Supabase JWTValidate the token and get or create the user
         """
+        # Recently validated token: skip RS256 verification and user lookup
+        cache_key = _token_cache_key(token)
+        user_pk = _get_cached_user_pk(cache_key)
+        if user_pk is not None:
+            try:
+                return (get_user_model().objects.get(pk=user_pk), token)
+            except Exception:
+                # Deleted user or database error: forget the token and fall
+                # through to full verification, which maps errors to 401
+                with _TOKEN_CACHE_LOCK:
+                    _TOKEN_CACHE.pop(cache_key, None)
+
         try:
             # Get the Supabase public key and validate the token
             payload = self.verify_token(token)
@@ -52,6 +404,7 @@ class SupabaseAuthentication(authentication.BaseAuthentication):
 
             # Get or create a Django user
             user = self.get_or_create_user(user_id, email, payload)
+            _cache_validated_token(cache_key, user.pk, payload)
 
             return (user, token)
 
@@ -71,57 +424,47 @@ class SupabaseAuthentication(authentication.BaseAuthentication):
         supabase_url = settings.SUPABASE_URL
         supabase_key = settings.SUPABASE_ANON_KEY
 
-        # Obtained from the JWT header kid (key id) 
-        unverified_header = jwt.get_unverified_header(token)
+        # Obtained from the JWT header kid (key id); the token is decoded once
+        # and the parts reused for verification
+        parts = _split_token(token)
+        unverified_header = parts[0]
 
-        # Get the Supabase public key
+        # Get the Supabase public key (cached per kid)
         jwks_url = f"{supabase_url}/auth/v1/jwks"
-        jwks_response = requests.get(jwks_url)
-        jwks = jwks_response.json()
-
-        # Finding the right public key
-        public_key = None
-        for key in jwks["keys"]:
-            if key["kid"] == unverified_header.get("kid"):
-                public_key = jwt.algorithms.RSAAlgorithm.from_jwk(key)
-                break
+        public_key = _get_public_key(jwks_url, unverified_header.get("kid"))
 
         if not public_key:
             raise jwt.InvalidTokenError("Unable to find appropriate key")
 
-        # Validate token
-        payload = jwt.decode(
-            token,
+        # Validate token; cached keys are always RSAPublicKey (see
+        # _store_public_key), so RS256 is verified directly
+        return _decode_rs256(
+            parts,
             public_key,
-            algorithms=["RS256"],
             audience="authenticated",
             issuer=f"{supabase_url}/auth/v1",
         )
 
-        return payload
-
     def get_or_create_user(self, user_id, email, payload):
         """
         Get or create Django users from Supabase user information
         """
         User = get_user_model()
 
-        # First, Search by Supabase UID
-        try:
-            user = User.objects.get(username=user_id)
-            return user
-        except User.DoesNotExist:
-            pass
-
-        # Next, Search by mail address
-        try:
-            user = User.objects.get(email=email)
-            # Update username to Supabase UID
-            user.username = user_id
-            user.save()
+        # Search by Supabase UID or mail address in one query; a UID match
+        # is ordered first so it takes precedence over a mail address match.
+        # email__iexact is served by auth_user_email_upper_idx (see box/apps.py)
+        user = (
+            User.objects.filter(Q(username=user_id) | Q(email__iexact=email))
+            .order_by(Case(When(username=user_id, then=0), default=1), "pk")
+            .first()
+        )
+        if user is not None:
+            if user.username != user_id:
+                # Update username to Supabase UID
+                User.objects.filter(pk=user.pk).update(username=user_id)
+                user.username = user_id
             return user
-        except User.DoesNotExist:
-            pass
 
         # Create new user
         user = User.objects.create_user(
@@ -1,7 +1,35 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
+
+
+def create_auth_user_email_index(using="default", **kwargs):
+    """Index auth_user(email) for SupabaseAuthentication's mail address lookup.
+
+    Django's default User model leaves email unindexed and the app's
+    migrations are generated per deployment, so the index is created here.
+    The expression matches the UPPER() that email__iexact compiles to.
+    """
+    from django.db import connections
+
+    connection = connections[using]
+    if connection.vendor != "postgresql":
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS auth_user_email_upper_idx "
+            "ON auth_user (UPPER(email))"
+        )
 
 
 class BoxConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "app.box"
     verbose_name = "Python File Box"
+
+    def ready(self):
+        from . import signals  # noqa: F401  (registers the post_delete file cleanup)
+        from .models import start_category_watcher
+
+        start_category_watcher()
+
+        post_migrate.connect(create_auth_user_email_index, sender=self)
@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from app.box.models import PythonFile
+
+
+class Command(BaseCommand):
+    help = "Fill node_classes_count for Python files saved before the column existed"
+
+    def handle(self, *args, **options):
+        updated = []
+        for python_file in PythonFile.objects.only("id", "node_classes", "node_classes_count"):
+            count = len(python_file.node_classes) if python_file.node_classes else 0
+            if python_file.node_classes_count != count:
+                python_file.node_classes_count = count
+                updated.append(python_file)
+
+        with transaction.atomic():
+            PythonFile.objects.bulk_update(updated, ["node_classes_count"], batch_size=500)
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Updated node_classes_count on {len(updated)} file(s)")
+        )
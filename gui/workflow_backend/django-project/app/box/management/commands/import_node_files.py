@@ -0,0 +1,76 @@
+from pathlib import Path
+
+from django.core.files import File
+from django.core.management.base import BaseCommand, CommandError
+from app.box.models import get_categories
+from app.box.services.python_file_service import PythonFileService
+
+
+class Command(BaseCommand):
+    help = "Upload Python node files in bulk, analysing them in parallel"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "paths",
+            nargs="+",
+            help="Python files, or folders whose *.py files are imported",
+        )
+        parser.add_argument(
+            "--category",
+            type=str,
+            default="analysis",
+            help="Node category for the imported files",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=None,
+            help="Maximum number of parsing processes (default: CPU count)",
+        )
+
+    def handle(self, *args, **options):
+        category = options["category"]
+        if category not in [choice[0] for choice in get_categories()]:
+            raise CommandError(f"Unknown category: {category}")
+
+        file_paths = []
+        for path in map(Path, options["paths"]):
+            if path.is_dir():
+                file_paths.extend(sorted(path.glob("*.py")))
+            elif path.is_file():
+                file_paths.append(path)
+            else:
+                raise CommandError(f"No such file or folder: {path}")
+
+        if not file_paths:
+            self.stdout.write("No Python files to import")
+            return
+
+        handles = [open(file_path, "rb") for file_path in file_paths]
+        try:
+            files = [
+                File(handle, name=file_path.name)
+                for handle, file_path in zip(handles, file_paths)
+            ]
+            python_files = PythonFileService().create_python_files_bulk(
+                files, category=category, max_workers=options["workers"]
+            )
+        finally:
+            for handle in handles:
+                handle.close()
+
+        for python_file in python_files:
+            if python_file.is_analyzed:
+                self.stdout.write(
+                    f"{python_file.name}: {len(python_file.node_classes)} node class(es)"
+                )
+            else:
+                self.stdout.write(
+                    self.style.WARNING(
+                        f"{python_file.name}: analysis failed: {python_file.analysis_error}"
+                    )
+                )
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Imported {len(python_files)} file(s) into {category}")
+        )
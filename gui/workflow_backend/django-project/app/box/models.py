@@ -2,12 +2,25 @@ from django.db import models
 from django.contrib.auth.models import User
 from pathlib import Path
 from django.conf import settings
+from functools import lru_cache
 import uuid
 import os
 import logging
 
+# watchdog import (optional - pushes category directory changes instead of polling)
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    WATCHDOG_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Category listing maintained by start_category_watcher() (None = not watching)
+_CATEGORIES = None
+_category_observer = None
+
 
 # Category options => Dynamically change
 NODE_CATEGORIES = [
@@ -19,18 +32,75 @@ NODE_CATEGORIES = [
     ['stimulus', 'Stimulus'],
 ]
 
+# Port types understood by the frontend; anything else is shown as "any"
+FRONTEND_PORT_TYPES = frozenset({
+    "int", "float", "str", "bool", "list", "dict", "object", "any",
+    "file_path", "csv_file", "json_file", "pickle_file", "numpy_file", "hdf5_file",
+})
+
+
 def get_categories():
     """Get the category directory as a list"""
+    categories = _CATEGORIES
+    if categories is None:
+        nodes_path = Path(settings.MEDIA_ROOT)
+        #if not os.path.isdir(nodes_path):
+        #    return NODE_CATEGORIES    
+        # Adding or removing a category directory changes MEDIA_ROOT's mtime,
+        # which invalidates the cached listing
+        mtime_ns = os.stat(nodes_path).st_mtime_ns
+        categories = _list_categories(str(nodes_path), mtime_ns)
+    return [list(category) for category in categories]
+
+
+def _scan_categories(nodes_path):
+    """List the category directories of nodes_path"""
     sub_directories = []
-    nodes_path = Path(settings.MEDIA_ROOT)
-    #if not os.path.isdir(nodes_path):
-    #    return NODE_CATEGORIES    
     for item in os.listdir(nodes_path):
         itemlarge = item.capitalize()
         if item == 'io':
             itemlarge = 'I/O'
-        sub_directories.append([item, itemlarge])
-    return sub_directories
+        sub_directories.append((item, itemlarge))
+    return tuple(sub_directories)
+
+
+@lru_cache(maxsize=1)
+def _list_categories(nodes_path, mtime_ns):
+    """List the category directories of nodes_path (cached per mtime)"""
+    return _scan_categories(nodes_path)
+
+
+def start_category_watcher():
+    """Keep _CATEGORIES up to date from filesystem events on MEDIA_ROOT
+
+    While the watcher runs, get_categories() does no filesystem calls.
+    Without watchdog (or if MEDIA_ROOT cannot be watched) it keeps using
+    the mtime-checked listing.
+    """
+    global _CATEGORIES, _category_observer
+    if not WATCHDOG_AVAILABLE or _category_observer is not None:
+        return
+
+    nodes_path = str(Path(settings.MEDIA_ROOT))
+
+    class CategoryEventHandler(FileSystemEventHandler):
+        def on_any_event(self, event):
+            global _CATEGORIES
+            if event.is_directory and event.event_type in ("created", "deleted", "moved"):
+                _CATEGORIES = _scan_categories(nodes_path)
+
+    observer = Observer()
+    try:
+        observer.schedule(CategoryEventHandler(), nodes_path, recursive=False)
+        observer.daemon = True
+        observer.start()
+    except OSError as e:
+        logger.warning(f"Category watcher not started for {nodes_path}: {e}")
+        return
+
+    _category_observer = observer
+    # Initial scan after the watch is in place so no change is missed
+    _CATEGORIES = _scan_categories(nodes_path)
 
 
 def get_upload_path(instance, filename):
@@ -41,10 +111,6 @@ def get_upload_path(instance, filename):
 
 class PythonFile(models.Model):
     """Uploaded Python File Model"""
-    
-    node_categories = get_categories()
-    logger.info(f"Dynamic categories:{node_categories}")
-    logger.info(f"MEDIA_ROOT：{settings.MEDIA_ROOT}")
 
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     name = models.CharField(max_length=255)
@@ -52,7 +118,7 @@ class PythonFile(models.Model):
     category = models.CharField(
         max_length=50,
         #choices=NODE_CATEGORIES,
-        choices=node_categories,
+        choices=get_categories,  # evaluated when used, not at import
         default='analysis',
         help_text='Node category for organizing files'
     )
@@ -70,6 +136,9 @@ class PythonFile(models.Model):
     node_classes = models.JSONField(
         default=dict, blank=True
     )  # Parsed node class information
+    node_classes_count = models.IntegerField(
+        default=0, db_index=True
+    )  # len(node_classes), kept in sync by save()
     is_analyzed = models.BooleanField(default=False)  # parsed flag
     analysis_error = models.TextField(blank=True, null=True)  # Parsing error information
 
@@ -89,6 +158,14 @@ class PythonFile(models.Model):
     def __str__(self):
         return self.name
 
+    def save(self, *args, **kwargs):
+        """Save, keeping node_classes_count in sync with node_classes"""
+        self.node_classes_count = len(self.node_classes) if self.node_classes else 0
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "node_classes" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "node_classes_count"}
+        super().save(*args, **kwargs)
+
     def get_node_classes_for_frontend(self):
         """Returns node class information for the frontend"""
         if not self.node_classes:
@@ -116,102 +193,61 @@ class PythonFile(models.Model):
 
     def _convert_to_full_schema(self, class_info):
         """Include all information in the schema (object format)"""
-        schema = {
-            "inputs": {},
-            "outputs": {},
-            "parameters": {},
-            "methods": class_info.get("methods", {}),
+        map_type = self._map_port_type_to_frontend
+
+        # Convert inputs (default_value/constraints only if they exist)
+        inputs = {
+            input_name: {
+                "name": input_name,
+                "type": map_type(input_info.get("type", "any")),
+                "description": input_info.get("description", ""),
+                "port_direction": "input",
+                "required": input_info.get("required", False),
+                "optional": input_info.get("optional", False),
+                **{key: input_info[key] for key in ("default_value", "constraints") if key in input_info},
+            }
+            for input_name, input_info in class_info.get("inputs", {}).items()
         }
 
-        # Convert inputs
-        if "inputs" in class_info:
-            for input_name, input_info in class_info["inputs"].items():
-                schema["inputs"][input_name] = {
-                    "name": input_name,
-                    "type": self._map_port_type_to_frontend(
-                        input_info.get("type", "any")
-                    ),
-                    "description": input_info.get("description", ""),
-                    "port_direction": "input",
-                    "required": input_info.get("required", False),
-                    "optional": input_info.get("optional", False),
-                }
-                # Add only if default_value exists
-                if "default_value" in input_info:
-                    schema["inputs"][input_name]["default_value"] = input_info[
-                        "default_value"
-                    ]
-                # Add only if there are constraints
-                if "constraints" in input_info:
-                    schema["inputs"][input_name]["constraints"] = input_info[
-                        "constraints"
-                    ]
-
         # Convert outputs
-        if "outputs" in class_info:
-            for output_name, output_info in class_info["outputs"].items():
-                schema["outputs"][output_name] = {
-                    "name": output_name,
-                    "type": self._map_port_type_to_frontend(
-                        output_info.get("type", "any")
-                    ),
-                    "description": output_info.get("description", ""),
-                    "port_direction": "output",
-                    "optional": output_info.get("optional", False),
-                }
-
-        # Convert parameters
-        if "parameters" in class_info:
-            schema["parameters"] = self._convert_parameters(
-                class_info.get("parameters", {})
-            )
-
-        return schema
+        outputs = {
+            output_name: {
+                "name": output_name,
+                "type": map_type(output_info.get("type", "any")),
+                "description": output_info.get("description", ""),
+                "port_direction": "output",
+                "optional": output_info.get("optional", False),
+            }
+            for output_name, output_info in class_info.get("outputs", {}).items()
+        }
+
+        return {
+            "inputs": inputs,
+            "outputs": outputs,
+            "parameters": self._convert_parameters(class_info.get("parameters", {})),
+            "methods": class_info.get("methods", {}),
+        }
 
     def _convert_parameters(self, parameters):
         """Convert parameters (preserve the original structure and add necessary information)"""
-        converted_params = {}
+        map_type = self._map_port_type_to_frontend
 
-        for param_name, param_info in parameters.items():
-            logger.debug(f"Python_file param_name: {param_name}")
-            param_data = {
+        # default_value, constraints (kept as is) and widget_type only if they exist
+        return {
+            param_name: {
                 "name": param_name,
-                "type": self._map_port_type_to_frontend(param_info.get("type", "any")),
+                "type": map_type(param_info.get("type", "any")),
                 "description": param_info.get("description", ""),
+                **{
+                    key: param_info[key]
+                    for key in ("default_value", "constraints", "widget_type")
+                    if key in param_info
+                },
             }
-
-            # Add only if default_value exists
-            if "default_value" in param_info:
-                param_data["default_value"] = param_info["default_value"]
-
-            # Add only if constraints exist (keep as is)
-            if "constraints" in param_info:
-                param_data["constraints"] = param_info["constraints"]
-
-            # If there is additional metadata such as widget_type
-            if "widget_type" in param_info:
-                param_data["widget_type"] = param_info["widget_type"]
-
-            converted_params[param_name] = param_data
-
-        return converted_params
+            for param_name, param_info in parameters.items()
+        }
 
     def _map_port_type_to_frontend(self, port_type):
         """Converting PortType to a type for the front end"""
-        type_mapping = {
-            "int": "int",
-            "float": "float",
-            "str": "str",
-            "bool": "bool",
-            "list": "list",
-            "dict": "dict",
-            "object": "object",
-            "any": "any",
-            "file_path": "file_path",
-            "csv_file": "csv_file",
-            "json_file": "json_file",
-            "pickle_file": "pickle_file",
-            "numpy_file": "numpy_file",
-            "hdf5_file": "hdf5_file",
-        }
-        return type_mapping.get(str(port_type).lower(), "any")
+        port_type = (port_type if isinstance(port_type, str) else str(port_type)).lower()
+        return port_type if port_type in FRONTEND_PORT_TYPES else "any"
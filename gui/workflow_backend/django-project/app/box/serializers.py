@@ -4,12 +4,16 @@ from .models import get_categories
 
 class PythonFileUploadSerializer(serializers.Serializer):
     """File upload serializer"""
-    node_categories = get_categories()
 
     file = serializers.FileField()
     name = serializers.CharField(max_length=255, required=False)
     description = serializers.CharField(required=False, allow_blank=True)
-    category = serializers.ChoiceField(choices=node_categories, default='analysis')
+    category = serializers.ChoiceField(choices=[], default='analysis')
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Categories follow the MEDIA_ROOT directories, so read them per use
+        self.fields["category"].choices = get_categories()
 
     def validate_file(self, value):
         """File validation"""
@@ -30,8 +34,6 @@ class PythonFileSerializer(serializers.ModelSerializer):
     uploaded_by_name = serializers.CharField(
         source="uploaded_by.username", read_only=True
     )
-    node_classes_count = serializers.SerializerMethodField()
-
     class Meta:
         model = PythonFile
         fields = [
@@ -53,10 +55,7 @@ class PythonFileSerializer(serializers.ModelSerializer):
             "id",
             "uploaded_by",
             "file_size",
+            "node_classes_count",
             "created_at",
             "updated_at",
         ]
-
-    def get_node_classes_count(self, obj):
-        """Returns the number of node classes"""
-        return len(obj.node_classes) if obj.node_classes else 0
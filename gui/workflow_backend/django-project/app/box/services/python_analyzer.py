@@ -1,12 +1,65 @@
 import ast
+import copy
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
 from typing import Dict, List, Optional, Any
 from enum import Enum
 import sqlite3
+import hashlib
 import json
+import os
+import re
+import threading
 import logging
 
 logger = logging.getLogger(__name__)
 
+# orjson import (optional - faster serialisation of node database rows)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Serialised forms of the common empty defaults
+EMPTY_DICT_JSON = "{}"
+EMPTY_LIST_JSON = "[]"
+
+# Compact JSON encoders reused for every row written to the node database
+_stdlib_json_encode = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+_json_encode_sorted = json.JSONEncoder(
+    separators=(",", ":"), ensure_ascii=False, sort_keys=True, default=str
+).encode
+
+
+def _json_encode(value: Any) -> str:
+    """Serialise a column value as compact JSON."""
+    if not value:
+        if value.__class__ is dict:
+            return EMPTY_DICT_JSON
+        if value.__class__ is list:
+            return EMPTY_LIST_JSON
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:
+            # e.g. integers beyond 64 bits; the stdlib encoder handles them
+            pass
+    return _stdlib_json_encode(value)
+
+
+def _node_content_hash(node_info: Dict[str, Any]) -> str:
+    """SHA-256 of a node's extracted information, used to skip unchanged saves."""
+    try:
+        serialized = _json_encode_sorted(node_info)
+    except TypeError:
+        # Keys that cannot be sorted or JSON-encoded (e.g. {1: "a", "b": 2});
+        # extraction order is deterministic, so repr() is stable for a source
+        serialized = repr(node_info)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
 class PortTypeMapping(Enum):
     """PortType enumeration mapping."""
 
@@ -26,17 +79,31 @@ class PortTypeMapping(Enum):
     HDF5_FILE = "hdf5_file"
 
 
+# PortType name -> front-end type name (e.g. "FILE_PATH" -> "file_path")
+PORT_TYPE_MAPPING = {member.name: member.value for member in PortTypeMapping}
+
+
 class NodeDatabase:
     """Database handler for node information."""
 
     def __init__(self, db_path: str = "nodes.db"):
         self.db_path = db_path
+        # One connection for the lifetime of the handler; transactions are
+        # issued explicitly (isolation_level=None) so a whole file's nodes
+        # are written in a single commit
+        self.conn = sqlite3.connect(
+            db_path, isolation_level=None, check_same_thread=False
+        )
+        self._lock = threading.Lock()
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
         self.init_database()
 
     def init_database(self):
         """Initialize database tables."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
+        with self._lock:
+            cursor = self.conn.cursor()
 
             # Nodes table
             cursor.execute(
@@ -46,10 +113,16 @@ class NodeDatabase:
                     class_name TEXT UNIQUE NOT NULL,
                     description TEXT,
                     node_type TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    content_hash TEXT
                 )
             """
             )
+            # Databases created before content_hash existed
+            columns = {row[1] for row in cursor.execute("PRAGMA table_info(nodes)")}
+            legacy_schema = "content_hash" not in columns
+            if legacy_schema:
+                cursor.execute("ALTER TABLE nodes ADD COLUMN content_hash TEXT")
 
             # Ports table (inputs and outputs)
             cursor.execute(
@@ -100,149 +173,406 @@ class NodeDatabase:
             """
             )
 
-            conn.commit()
+            # Older versions replaced node rows (new id) on every save, leaving
+            # the previous ports/parameters/methods rows orphaned
+            if legacy_schema:
+                for table in ("ports", "parameters", "methods"):
+                    cursor.execute(
+                        f"DELETE FROM {table} WHERE node_id NOT IN (SELECT id FROM nodes)"
+                    )
 
     def save_node(self, node_info: Dict[str, Any]) -> int:
         """Save node information to database."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
+        return self.save_nodes([node_info])[0]
+
+    def save_nodes(self, node_infos: List[Dict[str, Any]]) -> List[int]:
+        """
+        Save several nodes in one transaction.
 
-            # Insert or update node
+        Args:
+            node_infos: Node information dictionaries
+
+        Returns:
+            Database IDs of the saved nodes, in the same order
+        """
+        node_ids = []
+        with self._lock:
+            cursor = self.conn.cursor()
+            cursor.execute("BEGIN")
+            try:
+                for node_info in node_infos:
+                    node_ids.append(self._save_node_rows(cursor, node_info))
+                cursor.execute("COMMIT")
+            except BaseException:
+                cursor.execute("ROLLBACK")
+                raise
+        return node_ids
+
+    def _save_node_rows(self, cursor: sqlite3.Cursor, node_info: Dict[str, Any]) -> int:
+        """Write one node and its ports/parameters/methods (inside a transaction)."""
+        # Re-saving an unchanged file is the common case; skip it entirely
+        content_hash = _node_content_hash(node_info)
+        row = cursor.execute(
+            "SELECT id, content_hash FROM nodes WHERE class_name = ?",
+            (node_info["class_name"],),
+        ).fetchone()
+        if row is not None and row[1] == content_hash:
+            return row[0]
+
+        # Insert or update node (updating in place keeps the node id stable)
+        values = (
+            node_info.get("description", ""),
+            node_info.get("node_type", ""),
+            content_hash,
+        )
+        if row is None:
             cursor.execute(
                 """
-                INSERT OR REPLACE INTO nodes (class_name, description, node_type)
-                VALUES (?, ?, ?)
+                INSERT INTO nodes (description, node_type, content_hash, class_name)
+                VALUES (?, ?, ?, ?)
             """,
-                (
-                    node_info["class_name"],
-                    node_info.get("description", ""),
-                    node_info.get("node_type", ""),
-                ),
+                (*values, node_info["class_name"]),
             )
-
             node_id = cursor.lastrowid
+        else:
+            node_id = row[0]
+            cursor.execute(
+                "UPDATE nodes SET description = ?, node_type = ?, content_hash = ? WHERE id = ?",
+                (*values, node_id),
+            )
 
             # Clear existing related data
             cursor.execute("DELETE FROM ports WHERE node_id = ?", (node_id,))
             cursor.execute("DELETE FROM parameters WHERE node_id = ?", (node_id,))
             cursor.execute("DELETE FROM methods WHERE node_id = ?", (node_id,))
 
-            # Save inputs
-            for port_name, port_info in node_info.get("inputs", {}).items():
-                cursor.execute(
-                    """
-                    INSERT INTO ports (node_id, port_name, port_type, data_type, description, is_input)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                """,
-                    (
-                        node_id,
-                        port_name,
-                        "input",
-                        port_info.get("type", "any"),
-                        port_info.get("description", ""),
-                        True,
-                    ),
+        # Save inputs and outputs
+        ports = [
+            (
+                node_id,
+                port_name,
+                "input",
+                port_info.get("type", "any"),
+                port_info.get("description", ""),
+                True,
+            )
+            for port_name, port_info in node_info.get("inputs", {}).items()
+        ]
+        ports.extend(
+            (
+                node_id,
+                port_name,
+                "output",
+                port_info.get("type", "any"),
+                port_info.get("description", ""),
+                False,
+            )
+            for port_name, port_info in node_info.get("outputs", {}).items()
+        )
+        cursor.executemany(
+            """
+            INSERT INTO ports (node_id, port_name, port_type, data_type, description, is_input)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """,
+            ports,
+        )
+
+        # Save parameters
+        cursor.executemany(
+            """
+            INSERT INTO parameters (node_id, param_name, default_value, description, constraints)
+            VALUES (?, ?, ?, ?, ?)
+        """,
+            [
+                (
+                    node_id,
+                    param_name,
+                    _json_encode(param_info.get("default_value", {})),
+                    param_info.get("description", ""),
+                    _json_encode(param_info.get("constraints", {})),
                 )
+                for param_name, param_info in node_info.get("parameters", {}).items()
+            ],
+        )
 
-            # Save outputs
-            for port_name, port_info in node_info.get("outputs", {}).items():
-                cursor.execute(
-                    """
-                    INSERT INTO ports (node_id, port_name, port_type, data_type, description, is_input)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                """,
-                    (
-                        node_id,
-                        port_name,
-                        "output",
-                        port_info.get("type", "any"),
-                        port_info.get("description", ""),
-                        False,
-                    ),
+        # Save methods
+        cursor.executemany(
+            """
+            INSERT INTO methods (node_id, method_name, description, input_ports, output_ports)
+            VALUES (?, ?, ?, ?, ?)
+        """,
+            [
+                (
+                    node_id,
+                    method_name,
+                    method_info.get("description", ""),
+                    _json_encode(method_info.get("inputs", [])),
+                    _json_encode(method_info.get("outputs", [])),
                 )
+                for method_name, method_info in node_info.get("methods", {}).items()
+            ],
+        )
 
-            # Save parameters
-            for param_name, param_info in node_info.get("parameters", {}).items():
-                info_text = param_info.get("default_value", "")
-                """
-                if isinstance(info_text, list):
-                    info_text = json.dumps(info_text)
-                elif isinstance(info_text, dict):
-                    info_text = json.dumps(info_text)
-                """
-                cursor.execute(
-                    """
-                    INSERT INTO parameters (node_id, param_name, default_value, description, constraints)
-                    VALUES (?, ?, ?, ?, ?)
-                """,
-                    (
-                        node_id,
-                        param_name,
-                        #str(param_info.get("default_value", "")),
-                        #param_info.get("default_value", ""),
-                        json.dumps(param_info.get("default_value", {})),
-                        param_info.get("description", ""),
-                        json.dumps(param_info.get("constraints", {})),
-                    ),
-                )
+        return node_id
+
+
+# NodeDatabase handlers shared by every analyzer in the process, keyed by
+# absolute path, so the connection and schema setup happen once per file
+_node_databases: Dict[str, NodeDatabase] = {}
+_node_databases_lock = threading.Lock()
+
+
+def get_node_database(db_path: str = "nodes.db") -> NodeDatabase:
+    """Return the process-wide NodeDatabase for db_path, creating it on first use."""
+    key = os.path.abspath(db_path)
+    with _node_databases_lock:
+        db = _node_databases.get(key)
+        if db is None:
+            db = _node_databases[key] = NodeDatabase(db_path)
+        return db
+
+
+# Cheap pre-check: node classes assign NODE_DEFINITION at the start of a line
+_NODE_DEFINITION_RE = re.compile(r"^\s*NODE_DEFINITION\s*=", re.M)
+
+# Analysis results keyed by content SHA-256 (least recently used evicted first)
+ANALYSIS_CACHE_MAXSIZE = 256
+_analysis_cache: "OrderedDict[str, List[Dict[str, Any]]]" = OrderedDict()
+_analysis_cache_lock = threading.Lock()
 
-            # Save methods
-            for method_name, method_info in node_info.get("methods", {}).items():
-                cursor.execute(
-                    """
-                    INSERT INTO methods (node_id, method_name, description, input_ports, output_ports)
-                    VALUES (?, ?, ?, ?, ?)
-                """,
-                    (
-                        node_id,
-                        method_name,
-                        method_info.get("description", ""),
-                        json.dumps(method_info.get("inputs", [])),
-                        json.dumps(method_info.get("outputs", [])),
-                    ),
-                )
 
-            conn.commit()
-            return node_id
+# Parsing workers are not forked from the (threaded) server process, so they
+# cannot inherit locks held by other threads or the shared sqlite connection
+_PARSE_MP_CONTEXT = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+
+def _parse_worker(content: str):
+    """
+    Extract node information in a worker process (no database access)
+
+    Args:
+        content: Python file contents
+
+    Returns:
+        (nodes, None) on success or (None, error message) on invalid syntax
+    """
+    try:
+        return PythonNodeAnalyzer(db_path=None)._extract_nodes(content), None
+    except SyntaxError as e:
+        return None, f"Invalid Python syntax: {e}"
 
 
 class PythonNodeAnalyzer:
     """A service that parses node information from Python files"""
 
-    def __init__(self, db_path: str = "nodes.db"):
-        self.db = NodeDatabase(db_path)
+    def __init__(self, db_path: Optional[str] = "nodes.db"):
+        # db_path=None gives a parse-only analyzer (used by worker processes)
+        self.db = get_node_database(db_path) if db_path is not None else None
 
-    def analyze_file_content(self, content: str) -> List[Dict[str, Any]]:
+    def analyze_file_content(
+        self,
+        content: str,
+        tree: Optional[ast.AST] = None,
+        content_hash: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
         """
         Parse the contents of a Python file to extract node information
 
+        Results are cached per content hash, so analysing content seen
+        before (duplicate uploads, unchanged edits) skips parsing. The nodes
+        are still saved, since another file or process may have overwritten
+        the same class names since; unchanged rows are skipped by their
+        content hash. Content without any NODE_DEFINITION assignment cannot
+        contain node classes and is not parsed at all.
+
         Args:
             content: Python file contents
+            tree: AST of content if the caller already parsed it (optional)
+            content_hash: SHA-256 hex digest of the UTF-8 content if the
+                caller already computed it (optional)
 
         Returns:
             List of node information dictionaries
         """
-        try:
+        if tree is None and not _NODE_DEFINITION_RE.search(content):
+            return []
+
+        if content_hash is None:
+            content_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        nodes = self._get_cached(content_hash)
+        if nodes is None:
+            try:
+                nodes = self._extract_nodes(content, tree)
+            except SyntaxError as e:
+                raise ValueError(f"Invalid Python syntax: {e}")
+            self._set_cached(content_hash, nodes)
+
+        # Save to database (one transaction for the whole file)
+        self._save_nodes(nodes)
+        return nodes
+
+    def analyze_file_content_as_dict(
+        self, content: str, content_hash: Optional[str] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Parse the contents of a Python file into node information by class name
+
+        Args:
+            content: Python file contents
+            content_hash: SHA-256 hex digest of the UTF-8 content (optional)
+
+        Returns:
+            Node information dictionaries (without class_name) keyed by class name
+        """
+        return self.nodes_to_dict(
+            self.analyze_file_content(content, content_hash=content_hash)
+        )
+
+    @staticmethod
+    def nodes_to_dict(nodes: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """Key node information dicts by class name (the dicts are reused)."""
+        return {node.pop("class_name"): node for node in nodes}
+
+    def analyze_file_contents(
+        self,
+        contents: List[str],
+        content_hashes: Optional[List[str]] = None,
+        max_workers: Optional[int] = None,
+    ) -> List[tuple]:
+        """
+        Parse several Python files, spreading the parsing over processes
+
+        Parsing is CPU-bound and holds the GIL, so files that are neither
+        cached nor trivially free of node classes are parsed in a process
+        pool. The extracted nodes of all files are then saved in a single
+        database transaction.
+
+        Args:
+            contents: Python file contents
+            content_hashes: SHA-256 hex digests of the UTF-8 contents, in the
+                same order (optional)
+            max_workers: Maximum number of worker processes (optional)
+
+        Returns:
+            One (nodes, error) tuple per content, in the same order: error is
+            None on success, otherwise nodes is None and error the message
+        """
+        if content_hashes is None:
+            content_hashes = [
+                hashlib.sha256(content.encode("utf-8")).hexdigest()
+                for content in contents
+            ]
+
+        results: List[tuple] = [None] * len(contents)
+        pending = []
+        for index, (content, content_hash) in enumerate(zip(contents, content_hashes)):
+            if not _NODE_DEFINITION_RE.search(content):
+                results[index] = ([], None)
+                continue
+            cached = self._get_cached(content_hash)
+            if cached is not None:
+                results[index] = (cached, None)
+            else:
+                pending.append(index)
+
+        if len(pending) > 1:
+            with ProcessPoolExecutor(
+                max_workers=max_workers, mp_context=_PARSE_MP_CONTEXT
+            ) as executor:
+                parsed = list(
+                    executor.map(_parse_worker, [contents[index] for index in pending])
+                )
+        else:
+            parsed = [_parse_worker(contents[index]) for index in pending]
+
+        for index, (nodes, error) in zip(pending, parsed):
+            if error is None:
+                self._set_cached(content_hashes[index], nodes)
+            results[index] = (nodes, error)
+
+        # Save to database (one transaction for all files, cached ones included)
+        self._save_nodes(
+            [node for nodes, error in results if error is None for node in nodes]
+        )
+
+        return results
+
+    def _extract_nodes(
+        self, content: str, tree: Optional[ast.AST] = None
+    ) -> List[Dict[str, Any]]:
+        """Extract the node information of every node class in content."""
+        if tree is None:
             tree = ast.parse(content)
-            nodes = []
-
-            for node in ast.walk(tree):
-                if isinstance(node, ast.ClassDef):
-                    node_info = self._analyze_class_node(node, content, tree)
-                    if node_info:
-                        nodes.append(node_info)
-                        # Save to database
-                        node_id = self.db.save_node(node_info)
-                        print(
-                            f"Saved node '{node_info['class_name']}' with ID: {node_id}"
-                        )
-
-            return nodes
-        except SyntaxError as e:
-            raise ValueError(f"Invalid Python syntax: {e}")
+        nodes = []
+        for node in self._iter_class_defs(tree.body):
+            node_info = self._analyze_class_node(node, content)
+            if node_info:
+                nodes.append(node_info)
+        return nodes
+
+    def _save_nodes(self, nodes: List[Dict[str, Any]]) -> None:
+        """Save extracted nodes to the database in one transaction."""
+        node_ids = self.db.save_nodes(nodes)
+        if logger.isEnabledFor(logging.DEBUG):
+            for node_info, node_id in zip(nodes, node_ids):
+                logger.debug(
+                    "Saved node '%s' with ID: %s", node_info["class_name"], node_id
+                )
+
+    def _get_cached(self, content_hash: str) -> Optional[List[Dict[str, Any]]]:
+        """Return a copy of the cached analysis of content_hash, if any."""
+        with _analysis_cache_lock:
+            cached = _analysis_cache.get(content_hash)
+            if cached is not None:
+                _analysis_cache.move_to_end(content_hash)
+        if cached is None:
+            return None
+        # Callers may modify the returned dicts
+        return copy.deepcopy(cached)
+
+    def _set_cached(self, content_hash: str, nodes: List[Dict[str, Any]]) -> None:
+        """Cache a copy of the analysis of content_hash."""
+        with _analysis_cache_lock:
+            _analysis_cache[content_hash] = copy.deepcopy(nodes)
+            while len(_analysis_cache) > ANALYSIS_CACHE_MAXSIZE:
+                _analysis_cache.popitem(last=False)
+
+    def _iter_class_defs(self, body: List[ast.stmt]):
+        """
+        Yield the class definitions in a statement list
+
+        Only statements are visited: class bodies and the blocks of
+        if/try/with/for/while statements are searched, while function bodies
+        and expressions are skipped instead of walking the whole AST.
+
+        Args:
+            body: Statement list (e.g. module body)
+
+        Yields:
+            ast.ClassDef nodes
+        """
+        # Explicit stack of pending statements (pushed in reverse so they pop
+        # in source order) instead of one nested generator per block
+        stack = list(reversed(body))
+        while stack:
+            stmt = stack.pop()
+            if isinstance(stmt, ast.ClassDef):
+                yield stmt
+                stack.extend(reversed(stmt.body))
+            elif isinstance(stmt, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                continue
+            else:
+                for handler in reversed(getattr(stmt, "handlers", ())):
+                    stack.extend(reversed(handler.body))
+                for field in ("finalbody", "orelse", "body"):
+                    block = getattr(stmt, field, None)
+                    if block:
+                        stack.extend(reversed(block))
 
     def _analyze_class_node(
-        self, class_node: ast.ClassDef, content: str, tree: ast.AST
+        self, class_node: ast.ClassDef, content: str
     ) -> Optional[Dict[str, Any]]:
         """
         Parse class nodes to extract node information
@@ -250,7 +580,6 @@ class PythonNodeAnalyzer:
         Args:
             class_node: AST Class node
             content: Original file contents
-            tree: complete AST
 
         Returns:
             Node information dictionary or None
@@ -272,7 +601,7 @@ class PythonNodeAnalyzer:
 
         # Extract information from NODE_DEFINITION
         try:
-            definition_info = self._extract_node_definition_ast(node_definition, tree)
+            definition_info = self._extract_node_definition_ast(node_definition)
             #definition_info = {"class_name": class_node.name} | definition_info
             #return definition_info
             #result = {"class_name": class_node.name} | definition_info
@@ -302,18 +631,15 @@ class PythonNodeAnalyzer:
                 }
                 """
         except Exception as e:
-            print(f"Error analyzing class {class_node.name}: {e}")
+            logger.warning("Error analyzing class %s: %s", class_node.name, e)
             return None
 
-    def _extract_node_definition_ast(
-        self, node_def: ast.AST, tree: ast.AST
-    ) -> Dict[str, Any]:
+    def _extract_node_definition_ast(self, node_def: ast.AST) -> Dict[str, Any]:
         """
         Extracting information from NODE_DEFINITION using AST
 
         Args:
             node_def: NODE_DEFINITION, AST node
-            tree: Complete AST
 
         Returns:
             Extracted definition information
@@ -324,19 +650,11 @@ class PythonNodeAnalyzer:
             return result
 
         # Parsing NodeDefinitionSchema arguments
+        handlers = self._NODE_DEFINITION_FIELDS
         for keyword in node_def.keywords:
-            if keyword.arg == "description":
-                result["description"] = self._extract_string_value(keyword.value)
-            elif keyword.arg == "type":
-                result["type"] = self._extract_string_value(keyword.value)
-            elif keyword.arg == "inputs":
-                result["inputs"] = self._extract_port_dict(keyword.value, tree)
-            elif keyword.arg == "outputs":
-                result["outputs"] = self._extract_port_dict(keyword.value, tree)
-            elif keyword.arg == "parameters":
-                result["parameters"] = self._extract_parameter_dict(keyword.value)
-            elif keyword.arg == "methods":
-                result["methods"] = self._extract_method_dict(keyword.value)
+            handler = handlers.get(keyword.arg)
+            if handler is not None:
+                result[keyword.arg] = handler(self, keyword.value)
 
         return result
 
@@ -344,46 +662,40 @@ class PythonNodeAnalyzer:
         """extract string value"""
         if isinstance(node, ast.Constant):
             return str(node.value)
-        elif isinstance(node, ast.Str):  # for before Python 3.7
-            return node.s
         return ""
 
-    def _extract_port_dict(
-        self, node: ast.AST, tree: ast.AST
-    ) -> Dict[str, Dict[str, Any]]:
+    def _extract_port_dict(self, node: ast.AST) -> Dict[str, Dict[str, Any]]:
         """Extract the port definition dictionary"""
         if not isinstance(node, ast.Dict):
             return {}
 
         ports = {}
         for key, value in zip(node.keys, node.values):
-            if isinstance(key, (ast.Constant, ast.Str)):
+            if isinstance(key, ast.Constant):
                 port_name = self._extract_string_value(key)
-                port_info = self._extract_port_definition(value, tree)
+                port_info = self._extract_port_definition(value)
                 if port_info:
                     ports[port_name] = port_info
 
         return ports
 
-    def _extract_port_definition(self, node: ast.AST, tree: ast.AST) -> Dict[str, Any]:
+    def _extract_port_definition(self, node: ast.AST) -> Dict[str, Any]:
         """Extract information from the PortDefinition"""
         if isinstance(node, ast.Dict):
-            return self._extract_port_definition_dict(node, tree)
+            return self._extract_port_definition_dict(node)
         if not isinstance(node, ast.Call):
             return {}
 
         port_info = {}
+        handlers = self._PORT_FIELDS
         for keyword in node.keywords:
-            if keyword.arg == "type":
-                port_info["type"] = self._extract_port_type(keyword.value, tree)
-            elif keyword.arg == "description":
-                port_info["description"] = self._extract_string_value(keyword.value)
-            elif keyword.arg == "optional":
-                port_info["optional"] = self._extract_bool_value(keyword.value)
+            handler = handlers.get(keyword.arg)
+            if handler is not None:
+                port_info[keyword.arg] = handler(self, keyword.value)
 
         return port_info
 
-    def _extract_port_type(self, node: ast.AST, tree: ast.AST) -> str:
+    def _extract_port_type(self, node: ast.AST) -> str:
         """Extract and map PortTypes"""
         if isinstance(node, ast.Attribute):
             # PortType.OBJECT 
@@ -393,7 +705,7 @@ class PythonNodeAnalyzer:
         elif isinstance(node, ast.Name):
             # Direct variable reference
             return self._map_port_type(node.id.upper())
-        elif isinstance(node, (ast.Constant, ast.Str)):
+        elif isinstance(node, ast.Constant):
             # For direct strings
             return self._extract_string_value(node).lower()
 
@@ -409,25 +721,8 @@ class PythonNodeAnalyzer:
         Returns:
             Front-end model name
         """
-        type_mapping = {
-            "INT": "int",
-            "FLOAT": "float",
-            "STR": "str",
-            "BOOL": "bool",
-            "LIST": "list",
-            "DICT": "dict",
-            "OBJECT": "object",
-            "ANY": "any",
-            "FILE_PATH": "file_path",
-            "CSV_FILE": "csv_file",
-            "JSON_FILE": "json_file",
-            "PICKLE_FILE": "pickle_file",
-            "NUMPY_FILE": "numpy_file",
-            "HDF5_FILE": "hdf5_file",
-        }
-
-        mapped_type = type_mapping.get(port_type_name.upper(), "any")
-        print(f"Debug: Mapping {port_type_name} -> {mapped_type}")
+        mapped_type = PORT_TYPE_MAPPING.get(port_type_name.upper(), "any")
+        logger.debug("Mapping %s -> %s", port_type_name, mapped_type)
         return mapped_type
 
     def _extract_parameter_dict(self, node: ast.AST):
@@ -437,7 +732,7 @@ class PythonNodeAnalyzer:
 
         parameters = {}
         for key, value in zip(node.keys, node.values):
-            if isinstance(key, (ast.Constant, ast.Str)):
+            if isinstance(key, ast.Constant):
                 param_name = self._extract_string_value(key)
                 param_info = self._extract_parameter_definition(value)
                 if param_info:
@@ -452,21 +747,11 @@ class PythonNodeAnalyzer:
             return {}
 
         param_info = {}
+        handlers = self._PARAMETER_FIELDS
         for keyword in node.keywords:
-            if keyword.arg == "default_value":
-                param_info["default_value"] = self._extract_value(keyword.value)
-            elif keyword.arg == "description":
-                param_info["description"] = self._extract_string_value(keyword.value)
-            elif keyword.arg == "constraints":
-                param_info["constraints"] = self._extract_value(keyword.value) 
-            elif keyword.arg == "optimizable":
-                param_info["optimizable"] = self._extract_bool_value(keyword.value)
-            elif keyword.arg == "optimization_range":
-                param_info["optimization_range"] = self._extract_value(keyword.value)
-            elif keyword.arg == "suggested_values":
-                param_info["suggested_values"] = self._extract_value(keyword.value)
-            elif keyword.arg == "type":
-                param_info["type"] = self._extract_value(keyword.value)
+            handler = handlers.get(keyword.arg)
+            if handler is not None:
+                param_info[keyword.arg] = handler(self, keyword.value)
 
         return param_info
 
@@ -477,7 +762,7 @@ class PythonNodeAnalyzer:
 
         methods = {}
         for key, value in zip(node.keys, node.values):
-            if isinstance(key, (ast.Constant, ast.Str)):
+            if isinstance(key, ast.Constant):
                 method_name = self._extract_string_value(key)
                 method_info = self._extract_method_definition(value)
                 if method_info:
@@ -491,13 +776,11 @@ class PythonNodeAnalyzer:
             return {}
 
         method_info = {}
+        handlers = self._METHOD_FIELDS
         for keyword in node.keywords:
-            if keyword.arg == "description":
-                method_info["description"] = self._extract_string_value(keyword.value)
-            elif keyword.arg == "inputs":
-                method_info["inputs"] = self._extract_list_values(keyword.value)
-            elif keyword.arg == "outputs":
-                method_info["outputs"] = self._extract_list_values(keyword.value)
+            handler = handlers.get(keyword.arg)
+            if handler is not None:
+                method_info[keyword.arg] = handler(self, keyword.value)
 
         return method_info
 
@@ -516,34 +799,39 @@ class PythonNodeAnalyzer:
 
     def _extract_value(self, node: ast.AST) -> Any:
         """Extracting generic values"""
-        if isinstance(node, ast.Constant):
-            return node.value
-        elif isinstance(node, (ast.Str, ast.Num)):  # for before Python 3.7
-            return node.s if isinstance(node, ast.Str) else node.n
-        elif hasattr(ast, "NameConstant") and isinstance(node, ast.NameConstant):  # py<3.8
-            return node.value
-        elif isinstance(node, ast.List):
-            # Recursively extracting elements of an array
-            result = [self._extract_value(elem) for elem in node.elts]
-            return result
-            #return [self._extract_value(elem) for elem in node.elts]
-        elif isinstance(node, ast.Tuple):
-            return tuple(self._extract_value(elem) for elem in node.elts)
-        elif isinstance(node, ast.Dict):
-            # Recursively extract dictionary elements
-            result = {}
-            for key, value in zip(node.keys, node.values):
-                key_str = self._extract_value(key)
-                result[key_str] = self._extract_value(value)
-            return result
-        elif isinstance(node, ast.Name):
-            return node.id
-        elif isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
-            value = self._extract_value(node.operand)
-            if isinstance(value, (int, float)):
-                return -value if isinstance(node.op, ast.USub) else value
-        else:
+        # One lookup on the exact node class instead of an isinstance chain
+        handler = self._VALUE_EXTRACTORS.get(type(node))
+        if handler is None:
             return str(node)
+        return handler(self, node)
+
+    def _extract_constant_value(self, node: ast.Constant) -> Any:
+        return node.value
+
+    def _extract_list_value(self, node: ast.List) -> List[Any]:
+        # Recursively extracting elements of an array
+        return [self._extract_value(elem) for elem in node.elts]
+
+    def _extract_tuple_value(self, node: ast.Tuple) -> tuple:
+        return tuple(self._extract_value(elem) for elem in node.elts)
+
+    def _extract_dict_value(self, node: ast.Dict) -> Dict[Any, Any]:
+        # Recursively extract dictionary elements
+        return {
+            self._extract_value(key): self._extract_value(value)
+            for key, value in zip(node.keys, node.values)
+        }
+
+    def _extract_name_value(self, node: ast.Name) -> str:
+        return node.id
+
+    def _extract_unary_value(self, node: ast.UnaryOp) -> Any:
+        if not isinstance(node.op, (ast.USub, ast.UAdd)):
+            return str(node)
+        value = self._extract_value(node.operand)
+        if isinstance(value, (int, float)):
+            return -value if isinstance(node.op, ast.USub) else value
+        return None
 
     def _extract_constraints(self, node: ast.AST) -> Dict[str, Any]:
         """Extract constraint dictionary"""
@@ -552,7 +840,7 @@ class PythonNodeAnalyzer:
 
         constraints = {}
         for key, value in zip(node.keys, node.values):
-            if isinstance(key, (ast.Constant, ast.Str)):
+            if isinstance(key, ast.Constant):
                 constraint_name = self._extract_string_value(key)
                 constraint_value = self._extract_value(value)
                 constraints[constraint_name] = constraint_value
@@ -563,44 +851,74 @@ class PythonNodeAnalyzer:
         """Extract boolean value with safe fallback."""
         if isinstance(node, ast.Constant):
             return bool(node.value)
-        if hasattr(ast, "NameConstant") and isinstance(node, ast.NameConstant):
-            return bool(node.value)
         if isinstance(node, ast.Name):
             return node.id.lower() == "true"
         return False
 
-    def _extract_port_definition_dict(self, node: ast.Dict, tree: ast.AST) -> Dict[str, Any]:
+    def _extract_port_definition_dict(self, node: ast.Dict) -> Dict[str, Any]:
         """Extract port definition from a dict-style definition."""
         port_info = {}
+        handlers = self._PORT_FIELDS
         for key, value in zip(node.keys, node.values):
-            if isinstance(key, (ast.Constant, ast.Str)):
+            if isinstance(key, ast.Constant):
                 key_name = self._extract_string_value(key)
-                if key_name == "type":
-                    port_info["type"] = self._extract_port_type(value, tree)
-                elif key_name == "description":
-                    port_info["description"] = self._extract_string_value(value)
-                elif key_name == "optional":
-                    port_info["optional"] = self._extract_bool_value(value)
+                handler = handlers.get(key_name)
+                if handler is not None:
+                    port_info[key_name] = handler(self, value)
         return port_info
 
     def _extract_parameter_definition_dict(self, node: ast.Dict) -> Dict[str, Any]:
         """Extract parameter definition from a dict-style definition."""
         param_info = {}
+        handlers = self._PARAMETER_FIELDS
         for key, value in zip(node.keys, node.values):
-            if isinstance(key, (ast.Constant, ast.Str)):
+            if isinstance(key, ast.Constant):
                 key_name = self._extract_string_value(key)
-                if key_name == "default_value":
-                    param_info["default_value"] = self._extract_value(value)
-                elif key_name == "description":
-                    param_info["description"] = self._extract_string_value(value)
-                elif key_name == "constraints":
-                    param_info["constraints"] = self._extract_value(value)
-                elif key_name == "optimizable":
-                    param_info["optimizable"] = self._extract_bool_value(value)
-                elif key_name == "optimization_range":
-                    param_info["optimization_range"] = self._extract_value(value)
-                elif key_name == "suggested_values":
-                    param_info["suggested_values"] = self._extract_value(value)
-                elif key_name == "type":
-                    param_info["type"] = self._extract_value(value)
+                handler = handlers.get(key_name)
+                if handler is not None:
+                    param_info[key_name] = handler(self, value)
         return param_info
+
+    # Keyword (or dict key) -> extractor tables for the definition schemas.
+    # Defined after the extractors so the plain functions can be referenced;
+    # they are called as handler(self, value_node)
+    _NODE_DEFINITION_FIELDS = {
+        "description": _extract_string_value,
+        "type": _extract_string_value,
+        "inputs": _extract_port_dict,
+        "outputs": _extract_port_dict,
+        "parameters": _extract_parameter_dict,
+        "methods": _extract_method_dict,
+    }
+
+    _PORT_FIELDS = {
+        "type": _extract_port_type,
+        "description": _extract_string_value,
+        "optional": _extract_bool_value,
+    }
+
+    _PARAMETER_FIELDS = {
+        "default_value": _extract_value,
+        "description": _extract_string_value,
+        "constraints": _extract_value,
+        "optimizable": _extract_bool_value,
+        "optimization_range": _extract_value,
+        "suggested_values": _extract_value,
+        "type": _extract_value,
+    }
+
+    _METHOD_FIELDS = {
+        "description": _extract_string_value,
+        "inputs": _extract_list_values,
+        "outputs": _extract_list_values,
+    }
+
+    # AST node class -> generic value extractor used by _extract_value
+    _VALUE_EXTRACTORS = {
+        ast.Constant: _extract_constant_value,
+        ast.List: _extract_list_value,
+        ast.Tuple: _extract_tuple_value,
+        ast.Dict: _extract_dict_value,
+        ast.Name: _extract_name_value,
+        ast.UnaryOp: _extract_unary_value,
+    }
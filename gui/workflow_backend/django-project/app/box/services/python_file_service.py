@@ -1,6 +1,8 @@
 import os
 import hashlib
+import tempfile
 from django.core.files.storage import default_storage
+from django.db import transaction
 from ..models import PythonFile
 from .python_analyzer import PythonNodeAnalyzer
 import logging
@@ -10,9 +12,16 @@ logger = logging.getLogger(__name__)
 class PythonFileService:
     """Python file management service"""
 
+    # Columns written by each save; updated_at is listed so auto_now applies
+    # (PythonFile.save() adds node_classes_count alongside node_classes)
+    ANALYSIS_FIELDS = ["node_classes", "is_analyzed", "analysis_error", "updated_at"]
+    ANALYSIS_ERROR_FIELDS = ["is_analyzed", "analysis_error", "updated_at"]
+    CONTENT_FIELDS = ["file_content", "file_hash", "file_size", "file", "updated_at"]
+
     def __init__(self):
         self.analyzer = PythonNodeAnalyzer()
 
+    @transaction.atomic
     def create_python_file(self, file, user=None, name=None, description=None, category='analysis'):
         """
         Create a Python file and run the automated analysis
@@ -28,13 +37,19 @@ class PythonFileService:
             PythonFile instance
         """
         # read file contents
-        file_content = file.read().decode("utf-8")
+        raw_content = file.read()
 
-        # Calculate file hash (for duplicate check)
-        file_hash = hashlib.sha256(file_content.encode("utf-8")).hexdigest()
+        # Calculate file hash (for duplicate check) from the uploaded bytes;
+        # this equals the hash of the decoded text re-encoded as UTF-8
+        file_hash = hashlib.sha256(raw_content).hexdigest()
+        file_content = raw_content.decode("utf-8")
+        del raw_content
 
-        # duplicate check
-        existing_file = PythonFile.objects.filter(file_hash=file_hash).first()
+        # duplicate check (file_hash is unique, hence indexed); the stored
+        # content is replaced below, so it is not loaded
+        existing_file = (
+            PythonFile.objects.filter(file_hash=file_hash).defer("file_content").first()
+        )
         # overwrite
         #if existing_file:
         #    raise ValueError(f"File already exists: {existing_file.name}")
@@ -57,7 +72,7 @@ class PythonFileService:
                 file_hash=file_hash,
             )
             """
-            python_file = PythonFile.objects.get(id=existing_file.id)
+            python_file = existing_file
             python_file.name = name
             python_file.description = description or ""
             python_file.category = category
@@ -67,6 +82,7 @@ class PythonFileService:
             python_file.file_size = file.size
             python_file.file_hash = file_hash
             python_file.is_active = True
+            python_file.save()
         else:
             # Create PythonFile instance
             python_file = PythonFile.objects.create(
@@ -81,94 +97,173 @@ class PythonFileService:
             )
 
         # Automatic analysis execution
-        self._analyze_file(python_file)
+        self._analyze_file(python_file, content_hash=file_hash)
 
         return python_file
 
-    def _analyze_file(self, python_file):
+    def create_python_files_bulk(self, files, user=None, category='analysis', max_workers=None):
+        """
+        Create several Python files at once, analysing them in parallel
+
+        Parsing is spread over worker processes; the database writes happen
+        afterwards in one transaction, with new files inserted by bulk_create.
+        Files whose content already exists are updated as in create_python_file.
+
+        Args:
+            files: uploaded files
+            user: upload user
+            category: File Category (Optional)
+            max_workers: Maximum number of parsing processes (optional)
+
+        Returns:
+            List of PythonFile instances, in the same order as files
+        """
+        entries = []
+        for file in files:
+            raw_content = file.read()
+            file_hash = hashlib.sha256(raw_content).hexdigest()
+            entries.append((file, file_hash, raw_content.decode("utf-8")))
+            del raw_content
+
+        # duplicate check (one query for all files)
+        existing_files = PythonFile.objects.defer("file_content").in_bulk(
+            [file_hash for _, file_hash, _ in entries], field_name="file_hash"
+        )
+
+        results = self.analyzer.analyze_file_contents(
+            [file_content for _, _, file_content in entries],
+            content_hashes=[file_hash for _, file_hash, _ in entries],
+            max_workers=max_workers,
+        )
+
+        python_files = []
+        new_files = {}
+        for (file, file_hash, file_content), (node_classes, error) in zip(entries, results):
+            # Repeated content within the batch updates the same instance,
+            # as sequential create_python_file calls would
+            python_file = existing_files.get(file_hash) or new_files.get(file_hash)
+            if python_file is None:
+                python_file = new_files[file_hash] = PythonFile(file_hash=file_hash)
+            python_file.name = file.name
+            python_file.description = ""
+            python_file.category = category
+            python_file.file = file
+            python_file.file_content = file_content
+            python_file.uploaded_by = user
+            python_file.file_size = file.size
+            python_file.is_active = True
+            if error is None:
+                python_file.node_classes = self.analyzer.nodes_to_dict(node_classes)
+                python_file.is_analyzed = True
+                python_file.analysis_error = None
+            else:
+                python_file.is_analyzed = False
+                python_file.analysis_error = error
+                logger.warning("Failed to analyze file %s: %s", python_file.name, error)
+            python_files.append(python_file)
+
+        with transaction.atomic():
+            for python_file in existing_files.values():
+                python_file.save()
+            # bulk_create bypasses PythonFile.save(), which keeps the count in sync
+            for python_file in new_files.values():
+                python_file.node_classes_count = len(python_file.node_classes)
+            PythonFile.objects.bulk_create(new_files.values(), batch_size=500)
+
+        logger.info(
+            "Created %d and updated %d Python files",
+            len(new_files),
+            len(existing_files),
+        )
+        return python_files
+
+    def _analyze_file(self, python_file, content_hash=None):
         """
         Parse the file and extract node information
 
         Args:
             python_file: PythonFile instance
+            content_hash: SHA-256 of file_content, if already computed
         """
         try:
             # parse file contents
-            node_classes = self.analyzer.analyze_file_content(python_file.file_content)
+            node_classes = self.analyzer.analyze_file_content_as_dict(
+                python_file.file_content, content_hash=content_hash
+            )
 
-            print(f"Analyzed {len(node_classes)} node classes:")
-            for node in node_classes:
-                print(f"  - {node['class_name']}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Analyzed %d node classes: %s",
+                    len(node_classes),
+                    ", ".join(node_classes),
+                )
 
             # Save analysis results to DB
-            python_file.node_classes = {
-                node["class_name"]: {
-                    "description": node["description"],
-                    "node_type": node["node_type"],
-                    "parameters": node["parameters"],
-                    "inputs": node["inputs"],
-                    "outputs": node["outputs"],
-                    "methods": node["methods"],
-                }
-                for node in node_classes
-            }
+            python_file.node_classes = node_classes
 
             python_file.is_analyzed = True
             python_file.analysis_error = None
-            python_file.save()
+            python_file.save(update_fields=self.ANALYSIS_FIELDS)
 
-            print(
-                f"Successfully analyzed {len(node_classes)} node classes from {python_file.name}"
+            logger.info(
+                "Successfully analyzed %d node classes from %s",
+                len(node_classes),
+                python_file.name,
             )
 
         except Exception as e:
             # Even if analysis fails, the file will be saved, but error information will be recorded.
             python_file.is_analyzed = False
             python_file.analysis_error = str(e)
-            python_file.save()
+            python_file.save(update_fields=self.ANALYSIS_ERROR_FIELDS)
 
-            print(f"Failed to analyze file {python_file.name}: {e}")
+            logger.warning("Failed to analyze file %s: %s", python_file.name, e)
 
     def get_file_content(self, python_file):
         """Get file contents"""
         return python_file.file_content
 
+    @transaction.atomic
     def update_file_content(self, python_file, content):
         """Update the file contents, update the physical file, and re-analyze"""
         # file_content update field
         python_file.file_content = content
-        python_file.file_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
-        python_file.file_size = len(content.encode("utf-8"))
+        content_bytes = content.encode("utf-8")
+        file_hash = hashlib.sha256(content_bytes).hexdigest()
+        content_changed = file_hash != python_file.file_hash
+        python_file.file_hash = file_hash
+        python_file.file_size = len(content_bytes)
         
         # nodes/{category}/Update physical files in a folder
-        self._update_nodes_folder_file(python_file, content)
+        self._update_nodes_folder_file(python_file, content_bytes)
         
-        # Djangoのfile Also update the field (preserve existing implementation)
-        if python_file.file:
+        # Djangoのfile Also update the field (preserve existing implementation);
+        # the stored copy already holds this content if the hash is unchanged
+        if python_file.file and content_changed:
             try:
-                # Delete existing files
-                old_file_path = python_file.file.name
-                if default_storage.exists(old_file_path):
-                    default_storage.delete(old_file_path)
+                # Delete existing files (delete() already ignores a missing file)
+                default_storage.delete(python_file.file.name)
                 
                 # Create a physical file with the new file contents
                 from django.core.files.base import ContentFile
-                new_file = ContentFile(content.encode("utf-8"))
+                new_file = ContentFile(content_bytes)
                 python_file.file.save(python_file.name, new_file, save=False)
                 
             except Exception as e:
-                print(f"Warning: Failed to update Django file field for {python_file.name}: {e}")
+                logger.warning(
+                    "Failed to update Django file field for %s: %s", python_file.name, e
+                )
         
-        # Save DB
-        python_file.save()
+        # Save DB (only the columns changed above)
+        python_file.save(update_fields=self.CONTENT_FIELDS)
 
         # Execute reanalysis
-        self._analyze_file(python_file)
+        self._analyze_file(python_file, content_hash=file_hash)
 
         return python_file
     
-    def _update_nodes_folder_file(self, python_file, content):
-        """nodes/{category}/Update physical files in a folder"""
+    def _update_nodes_folder_file(self, python_file, content_bytes):
+        """nodes/{category}/Update physical files in a folder (content as UTF-8 bytes)"""
         try:
             from django.conf import settings
             from pathlib import Path
@@ -190,14 +285,27 @@ class PythonFileService:
             # build file path
             file_path = nodes_folder / filename
             
-            # write to file
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            # write to a temporary file and rename it into place, so readers
+            # never see a partially written file
+            fd, tmp_path = tempfile.mkstemp(dir=nodes_folder, suffix='.py.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    os.fchmod(f.fileno(), 0o644)
+                    f.write(content_bytes)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, file_path)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+                raise
             
-            print(f"Successfully updated physical file: {file_path}")
+            logger.debug("Successfully updated physical file: %s", file_path)
             
         except Exception as e:
-            print(f"Warning: Failed to update nodes folder file for {python_file.name}: {e}")
+            logger.warning(
+                "Failed to update nodes folder file for %s: %s", python_file.name, e
+            )
             # Even if the physical file update fails, the DB is updated, so processing continues
 
     def validate_python_syntax(self, content):
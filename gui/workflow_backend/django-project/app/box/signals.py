@@ -0,0 +1,33 @@
+from concurrent.futures import ThreadPoolExecutor
+from django.db import transaction
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+from .models import PythonFile
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Stored files are write-once per row, so removing them can happen off the
+# request thread; bulk deletes (e.g. admin "delete selected") unlink in parallel
+_file_cleanup_executor = ThreadPoolExecutor(
+    max_workers=4, thread_name_prefix="box-file-cleanup"
+)
+
+
+def _delete_stored_file(storage, name):
+    """Remove a stored file; storage.delete ignores files that are already gone"""
+    try:
+        storage.delete(name)
+    except Exception as e:
+        logger.warning(f"Failed to delete file from filesystem: {name}: {e}")
+
+
+@receiver(post_delete, sender=PythonFile)
+def delete_python_file_on_row_delete(sender, instance, **kwargs):
+    """Remove the uploaded file once the row deletion has been committed"""
+    if not instance.file:
+        return
+    storage, name = instance.file.storage, instance.file.name
+    transaction.on_commit(
+        lambda: _file_cleanup_executor.submit(_delete_stored_file, storage, name)
+    )
@@ -84,8 +84,14 @@ class PythonFileListView(APIView):
             serializer = PythonFileSerializer(python_file, context={"request": request})
             return Response(serializer.data)
         else:
-            # get list
-            python_files = PythonFile.objects.filter(is_active=True)
+            # get list (the serializer never reads file_content or node_classes,
+            # which hold whole source files and their parsed schemas;
+            # uploaded_by is joined for uploaded_by_name)
+            python_files = (
+                PythonFile.objects.filter(is_active=True)
+                .defer("file_content", "node_classes")
+                .select_related("uploaded_by")
+            )
 
             # filtering
             name = request.query_params.get("name")
@@ -1690,7 +1696,7 @@ class BulkSyncNodesView(APIView):
                     | models.Q(name=filename, category=category)
                 )
                 & models.Q(is_active=True)
-            ).first()
+            ).only("id", "name", "file_hash").first()
 
             if existing_file:
                 # Provides more detailed reasons for duplication
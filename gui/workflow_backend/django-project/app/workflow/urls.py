@@ -8,6 +8,7 @@ from .views import (
     BatchWorkflowRunView,
     FlowNodeInstanceNameUpdateView,
     FlowNodeParameterUpdateView,
+    FlowNodeParameterBulkUpdateView,
 )
 
 app_name = "workflow"
@@ -77,6 +78,11 @@ urlpatterns = [
         FlowNodeParameterUpdateView.as_view(),
         name="node-parameter-update"
     ),  # PUT(node schema.parameters update)
+    path(
+        "<uuid:workflow_id>/nodes/<str:node_id>/parameters/bulk/",
+        FlowNodeParameterBulkUpdateView.as_view(),
+        name="node-parameter-bulk-update"
+    ),  # PUT(several node schema.parameters updates in one request)
     # Batch Code Generation - New Addition
     path(
         "<uuid:workflow_id>/generate-code/",
@@ -126,6 +132,7 @@ PUT    /workflow/{workflow_id}/nodes/{node_id}/instance_name/  # Update the node
 
 # Update node parameters
 PUT    /workflow/{workflow_id}/nodes/{node_id}/parameters/  # Update the node's schema.parameters
+PUT    /workflow/{workflow_id}/nodes/{node_id}/parameters/bulk/  # Update several schema.parameters at once
 
 # Batch code generation
 POST   /workflow/{workflow_id}/generate-code/  # React Flow batch code generation from JSON
@@ -154,6 +161,21 @@ Response: {
   "parameter_value": 100
 }
 
+# Update several node parameters in one request
+PUT /workflow/{workflow_id}/nodes/{node_id}/parameters/bulk/
+{
+  "updates": [
+    {"key": "record_from_population", "value": 100, "field": "value"},
+    {"key": "simulation_time", "value": 500.0}  # field defaults to 'value'
+  ]
+}
+Response: {
+  "status": "success",
+  "message": "2 parameter update(s) applied successfully",
+  "node_id": "node_id",
+  "updated_parameters": {...}
+}
+
 # Batch code generation
 POST /workflow/{workflow_id}/generate-code/
 {
@@ -702,6 +702,96 @@ class FlowNodeParameterUpdateView(APIView):
         print(f"🔍 DEBUG: Final modifications data: {modifications}", flush=True)
 
 
+@method_decorator(csrf_exempt, name="dispatch")
+class FlowNodeParameterBulkUpdateView(FlowNodeParameterUpdateView):
+    """Update several schema.parameters of a FlowNode in one request"""
+
+    def put(self, request, workflow_id, node_id):
+        """Apply a list of parameter updates and save the node once"""
+        # Resolve the node outside the try block so a missing one is a 404
+        project = get_object_or_404(FlowProject, id=workflow_id)
+        node = get_object_or_404(FlowNode, id=node_id, project=project)
+
+        try:
+            updates = request.data.get("updates")
+            if not isinstance(updates, list) or not updates:
+                return Response(
+                    {"error": "updates must be a non-empty list"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            with transaction.atomic():
+                node = FlowNode.objects.select_for_update().get(pk=node.pk)
+
+                parameters = node.data.get("schema", {}).get("parameters")
+                if parameters is None:
+                    return Response(
+                        {"error": "Node parameters not found in schema"},
+                        status=status.HTTP_400_BAD_REQUEST,
+                    )
+
+                # Validate every update before touching the node so a bad entry
+                # leaves all parameters unchanged
+                for update in updates:
+                    if not isinstance(update, dict):
+                        return Response(
+                            {"error": "every update must be an object"},
+                            status=status.HTTP_400_BAD_REQUEST,
+                        )
+                    parameter_key = update.get("key")
+                    if not parameter_key:
+                        return Response(
+                            {"error": "key is required for every update"},
+                            status=status.HTTP_400_BAD_REQUEST,
+                        )
+                    if update.get("value") is None:
+                        return Response(
+                            {"error": f"value is required for parameter '{parameter_key}'"},
+                            status=status.HTTP_400_BAD_REQUEST,
+                        )
+                    if parameter_key not in parameters:
+                        return Response(
+                            {"error": f"Parameter '{parameter_key}' not found. Available: {list(parameters.keys())}"},
+                            status=status.HTTP_400_BAD_REQUEST,
+                        )
+
+                for update in updates:
+                    parameter_key = update["key"]
+                    parameter_value = update["value"]
+                    parameter_field = update.get("field", "value")
+
+                    original_value = parameters[parameter_key].get(parameter_field)
+                    parameters[parameter_key][parameter_field] = parameter_value
+                    self._update_parameter_modification_status(
+                        node.data, parameter_key, parameter_field,
+                        parameters[parameter_key],
+                        parameter_value,
+                        original_value
+                    )
+
+                node.save()
+
+            updated_keys = list(dict.fromkeys(update["key"] for update in updates))
+            logger.info(f"Successfully updated {len(updates)} parameter field(s) in node {node_id}")
+
+            return Response(
+                {
+                    "status": "success",
+                    "message": f"{len(updates)} parameter update(s) applied successfully",
+                    "node_id": node_id,
+                    "workflow_id": str(workflow_id),
+                    "updated_parameters": {key: parameters[key] for key in updated_keys},
+                }
+            )
+
+        except Exception as e:
+            logger.error(f"Bulk parameter update failed for node {node_id}: {e}", exc_info=True)
+            return Response(
+                {"error": f"Bulk parameter update failed: {str(e)}"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+
 @method_decorator(csrf_exempt, name="dispatch")
 class BatchCodeGenerationView(APIView):
     """React Flow's JSON to Batch Code Generation View"""
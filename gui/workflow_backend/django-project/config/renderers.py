@@ -0,0 +1,33 @@
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+# orjson import (optional - faster rendering of large node_classes payloads)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer that serializes with orjson when it is installed
+
+    Types orjson does not handle natively (Decimal, lazy translation
+    strings, querysets, ...) go through DRF's JSONEncoder. Indented output
+    (browsable API / ?indent=) and installs without orjson fall back to the
+    stock renderer.
+    """
+
+    _default = staticmethod(JSONEncoder().default)
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        if not ORJSON_AVAILABLE or self.get_indent(
+            accepted_media_type, renderer_context or {}
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+        return orjson.dumps(
+            data, default=self._default, option=orjson.OPT_NON_STR_KEYS
+        )
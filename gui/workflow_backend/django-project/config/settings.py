@@ -119,7 +119,7 @@ REST_FRAMEWORK = {
         "rest_framework.permissions.AllowAny",  
     ],
     "DEFAULT_RENDERER_CLASSES": [
-        "rest_framework.renderers.JSONRenderer",
+        "config.renderers.ORJSONRenderer",
     ],
     "DEFAULT_PARSER_CLASSES": [
         "rest_framework.parsers.JSONParser",
@@ -283,6 +283,10 @@ LOGGING = {
             "level": "INFO",
             "propagate": True,
         },
+        # Per-node/per-file analysis details are logged at DEBUG
+        "app.box.services": {
+            "level": "INFO",
+        },
     },
 }
 
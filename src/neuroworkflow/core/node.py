@@ -44,6 +44,10 @@ class Node:
         description='Base node class'
     )
     
+    # Relative runtime estimate used by the workflow scheduler to prioritize
+    # nodes on the critical path; override in expensive nodes
+    estimated_cost: float = 1.0
+    
     def __init__(self, name: str, description: str = ""):
         """Initialize a node.
         
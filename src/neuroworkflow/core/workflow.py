@@ -7,6 +7,9 @@ a fluent interface for creating workflows.
 """
 
 from typing import Dict, List, Set, Optional, Any
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+import heapq
+import threading
 import time
 from neuroworkflow.core.node import Node
 
@@ -55,7 +58,9 @@ class Workflow:
         self.connections = connections
         self.context: Dict[str, Any] = context or {}
         self._execution_order: List[str] = []
+        self._successors: Dict[str, List[str]] = {}  # Adjacency index built with the execution order
         self._execution_sequence: List[Dict[str, Any]] = []  # Track execution order and metadata
+        self._execution_lock = threading.Lock()
         
         if self.context:
             for node in self.nodes.values():
@@ -70,6 +75,10 @@ class Workflow:
         Raises:
             ValueError: If the workflow contains a cycle
         """
+        # Index successors once so the sort is O(V + E) instead of
+        # scanning every connection for every node
+        self._successors = self._build_successors()
+        
         # Simple topological sort
         visited: Set[str] = set()
         temp_visited: Set[str] = set()
@@ -93,9 +102,8 @@ class Workflow:
             temp_visited.add(node_name)
             
             # Visit all nodes that depend on this node
-            for conn in self.connections:
-                if conn.from_node == node_name:
-                    visit(conn.to_node)
+            for target in self._successors.get(node_name, ()):
+                visit(target)
                     
             temp_visited.remove(node_name)
             visited.add(node_name)
@@ -108,6 +116,25 @@ class Workflow:
                 
         # Reverse to get correct execution order
         self._execution_order = list(reversed(order))
+    
+    def _build_successors(self) -> Dict[str, List[str]]:
+        """Build the successor lists of the connection graph.
+        
+        Parallel connections between the same two nodes (several ports)
+        collapse into a single edge.
+        
+        Returns:
+            Dictionary of node name to the names of its successors, in
+            connection order
+        """
+        successors: Dict[str, List[str]] = {name: [] for name in self.nodes}
+        seen: Set[tuple] = set()
+        for conn in self.connections:
+            edge = (conn.from_node, conn.to_node)
+            if edge not in seen:
+                seen.add(edge)
+                successors.setdefault(conn.from_node, []).append(conn.to_node)
+        return successors
         
     def validate(self) -> bool:
         """Validate the workflow.
@@ -165,9 +192,17 @@ class Workflow:
             
         return True
         
-    def execute(self) -> bool:
+    def execute(self, max_workers: int = 1) -> bool:
         """Execute the workflow with execution tracking.
         
+        With max_workers > 1, nodes whose upstream nodes have all finished are
+        dispatched concurrently on a thread pool, so independent branches of
+        the DAG run in parallel. Only enable this for nodes that are safe to
+        run concurrently (e.g. not sharing a global simulator kernel).
+        
+        Args:
+            max_workers: Maximum number of nodes executed at the same time
+        
         Returns:
             True if execution was successful, False otherwise
         """
@@ -178,18 +213,102 @@ class Workflow:
         if not self._execution_order:
             self._compute_execution_order()
             
+        if max_workers > 1:
+            return self._execute_parallel(max_workers)
+            
         # Execute nodes in order with tracking
         for node_name in self._execution_order:
-            node = self.nodes[node_name]
+            if not self._execute_node(node_name):
+                return False
+                
+        return True
+    
+    def _execute_parallel(self, max_workers: int) -> bool:
+        """Execute the workflow, running independent nodes concurrently.
+        
+        Args:
+            max_workers: Maximum number of nodes executed at the same time
             
-            # Track execution start
-            start_time = time.time()
-            print(f"Executing node: {node_name}")
+        Returns:
+            True if execution was successful, False otherwise
+        """
+        # In-degrees from the successor index built with the execution order
+        successors = self._successors
+        in_degree: Dict[str, int] = {name: 0 for name in self.nodes}
+        for targets in successors.values():
+            for target in targets:
+                in_degree[target] += 1
+                
+        # Ready nodes are started by descending critical-path weight so that
+        # long chains (e.g. download -> connectivity -> simulator) are never
+        # delayed by cheap side branches; ties keep topological order
+        weights = self._compute_downstream_weights(successors)
+        position = {name: i for i, name in enumerate(self._execution_order)}
+        ready = [(-weights[name], position[name], name)
+                 for name in self._execution_order if in_degree[name] == 0]
+        heapq.heapify(ready)
+        success = True
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            running = {}
+            while ready or running:
+                while ready and success:
+                    node_name = heapq.heappop(ready)[2]
+                    running[executor.submit(self._execute_node, node_name)] = node_name
+                if not running:
+                    break
+                    
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    node_name = running.pop(future)
+                    if not future.result():
+                        # Let running nodes finish but do not start new ones
+                        success = False
+                        continue
+                    for target in successors[node_name]:
+                        in_degree[target] -= 1
+                        if in_degree[target] == 0:
+                            heapq.heappush(ready, (-weights[target], position[target], target))
+                            
+        return success
+    
+    def _compute_downstream_weights(self, successors: Dict[str, List[str]]) -> Dict[str, float]:
+        """Compute the longest-path cost from each node to a sink.
+        
+        weight[n] = estimated_cost[n] + max(weight[s] for s in successors[n])
+        
+        Args:
+            successors: Mapping of node name to the names of its successors
             
-            # Execute the node
-            success = node.process()
+        Returns:
+            Dictionary of node name to downstream weight
+        """
+        weights: Dict[str, float] = {}
+        for name in reversed(self._execution_order):
+            downstream = max((weights[target] for target in successors[name]), default=0.0)
+            weights[name] = getattr(self.nodes[name], 'estimated_cost', 1.0) + downstream
+        return weights
+    
+    def _execute_node(self, node_name: str) -> bool:
+        """Execute a single node and record it in the execution sequence.
+        
+        Args:
+            node_name: Name of the node to execute
             
-            # Track execution metadata
+        Returns:
+            True if execution was successful, False otherwise
+        """
+        node = self.nodes[node_name]
+        
+        # Track execution start
+        start_time = time.time()
+        print(f"Executing node: {node_name}")
+        
+        # Execute the node
+        success = node.process()
+        
+        # Track execution metadata
+        with self._execution_lock:
             execution_entry = {
                 'node_name': node_name,
                 'node_instance': node,  # Direct reference to node object
@@ -204,12 +323,11 @@ class Workflow:
             }
             
             self._execution_sequence.append(execution_entry)
+        
+        if not success:
+            print(f"Error executing node: {node_name}")
             
-            if not success:
-                print(f"Error executing node: {node_name}")
-                return False
-                
-        return True
+        return success
     
     def _node_has_output_port(self, node, port_name: str) -> bool:
         """Check if node has a specific output port with content.
@@ -302,6 +420,9 @@ class WorkflowBuilder:
         self.name = name
         self.nodes: Dict[str, Node] = {}
         self.connections: List[Connection] = []
+        # (from_node, from_port, to_node, to_port) of every connection, for
+        # constant-time duplicate checks
+        self._connection_keys: Set[tuple] = set()
         self.context: Dict[str, Any] = context or {}
         self._execution_sequence: List[Dict[str, Any]] = []  # Track execution order and metadata
 
@@ -365,20 +486,15 @@ class WorkflowBuilder:
             raise ValueError(f"Target node '{to_node}' not found in workflow")
         
         # Check for duplicate connections
-        if not allow_duplicates:
-            for existing_conn in self.connections:
-                if (existing_conn.from_node == from_node and 
-                    existing_conn.from_port == from_port and
-                    existing_conn.to_node == to_node and 
-                    existing_conn.to_port == to_port):
-                    
-                    if strict:
-                        # Strict mode: raise error
-                        raise ValueError(f"Connection already exists: {from_node}.{from_port} -> {to_node}.{to_port}. "
-                                       f"Use allow_duplicates=True to override.")
-                    else:
-                        # Default mode: silently skip (Jupyter-friendly)
-                        return self
+        key = (from_node, from_port, to_node, to_port)
+        if not allow_duplicates and key in self._connection_keys:
+            if strict:
+                # Strict mode: raise error
+                raise ValueError(f"Connection already exists: {from_node}.{from_port} -> {to_node}.{to_port}. "
+                               f"Use allow_duplicates=True to override.")
+            else:
+                # Default mode: silently skip (Jupyter-friendly)
+                return self
         
         # Get nodes for port-level duplicate checking
         source_node = self.nodes[from_node]
@@ -410,6 +526,7 @@ class WorkflowBuilder:
         # Create the connection
         connection = Connection(from_node, from_port, to_node, to_port)
         self.connections.append(connection)
+        self._connection_keys.add(key)
         
         # Connect the nodes
         source_node.connect_to(from_port, target_node, to_port)
@@ -428,13 +545,7 @@ class WorkflowBuilder:
         Returns:
             True if connection exists, False otherwise
         """
-        for existing_conn in self.connections:
-            if (existing_conn.from_node == from_node and 
-                existing_conn.from_port == from_port and
-                existing_conn.to_node == to_node and 
-                existing_conn.to_port == to_port):
-                return True
-        return False
+        return (from_node, from_port, to_node, to_port) in self._connection_keys
     
     def connect_safe(self, from_node: str, from_port: str, to_node: str, to_port: str) -> 'WorkflowBuilder':
         """Connect two nodes, silently skipping if connection already exists.
@@ -497,6 +608,7 @@ class WorkflowBuilder:
         """
         # Clear workflow connections
         self.connections.clear()
+        self._connection_keys.clear()
         
         # Clear port connections
         for node in self.nodes.values():
@@ -532,9 +644,12 @@ class WorkflowBuilder:
         """
         return Workflow(self.name, self.nodes, self.connections, context=self.context)
     
-    def execute_workflow(self) -> bool:
+    def execute_workflow(self, max_workers: int = 1) -> bool:
         """Execute the workflow and track execution sequence.
         
+        Args:
+            max_workers: Maximum number of nodes executed at the same time
+        
         Returns:
             True if execution was successful, False otherwise
         """
@@ -545,53 +660,21 @@ class WorkflowBuilder:
         workflow = self.build()
         
         # Execute with tracking
-        return self._execute_with_tracking(workflow)
+        return self._execute_with_tracking(workflow, max_workers)
     
-    def _execute_with_tracking(self, workflow: Workflow) -> bool:
+    def _execute_with_tracking(self, workflow: Workflow, max_workers: int = 1) -> bool:
         """Execute workflow while tracking execution sequence.
         
         Args:
             workflow: The workflow to execute
+            max_workers: Maximum number of nodes executed at the same time
             
         Returns:
             True if execution was successful, False otherwise
         """
-        # Compute execution order if not already done
-        if not workflow._execution_order:
-            workflow._compute_execution_order()
-
-        # Execute nodes in order with tracking
-        for node_name in workflow._execution_order:
-            node = workflow.nodes[node_name]
-            
-            # Track execution start
-            start_time = time.time()
-            print(f"Executing node: {node_name}")
-            
-            # Execute the node
-            success = node.process()
-            
-            # Track execution metadata
-            execution_entry = {
-                'node_name': node_name,
-                'node_instance': node,  # Direct reference to node object
-                'node_type': getattr(getattr(node, 'NODE_DEFINITION', None), 'type', 'unknown'),
-                'execution_order': len(self._execution_sequence),
-                'timestamp': start_time,
-                'duration': time.time() - start_time,
-                'success': success,
-                'has_python_script': self._node_has_output_port(node, 'python_script'),
-                'has_notebook_cell': self._node_has_output_port(node, 'notebook_cell'),
-                'output_ports': list(node._output_ports.keys()) if hasattr(node, '_output_ports') else []
-            }
-            
-            self._execution_sequence.append(execution_entry)
-            
-            if not success:
-                print(f"Error executing node: {node_name}")
-                return False
-
-        return True
+        success = workflow.execute(max_workers)
+        self._execution_sequence.extend(workflow._execution_sequence)
+        return success
     
     def _node_has_output_port(self, node, port_name: str) -> bool:
         """Check if node has a specific output port with content.
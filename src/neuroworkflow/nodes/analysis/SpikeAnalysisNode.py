@@ -176,32 +176,47 @@ class SpikeAnalysisNode(Node):
                 metrics = [m for m in metrics if m in valid_metrics]
                 break
         
-        # Calculate firing rates
-        firing_rates = {}
-        for neuron_id, spike_times in extracted_spikes.items():
-            # Calculate rate as spikes per second
-            duration_sec = (end_time - start_time) / 1000.0
-            rate = len(spike_times) / duration_sec if duration_sec > 0 else 0
-            firing_rates[neuron_id] = rate
+        # Flatten spikes into contiguous (sender, time) arrays
+        neuron_ids = list(extracted_spikes.keys())
+        counts = np.fromiter((len(extracted_spikes[n]) for n in neuron_ids),
+                             dtype=np.int64, count=len(neuron_ids))
+        if counts.sum() > 0:
+            times = np.concatenate([np.asarray(extracted_spikes[n], dtype=np.float64) for n in neuron_ids])
+        else:
+            times = np.empty(0, dtype=np.float64)
+        senders = np.repeat(np.arange(len(neuron_ids)), counts)
+        
+        # Group by neuron so each neuron's spikes are contiguous; the stable
+        # sort keeps each neuron's spikes in recorded order, as before
+        order = np.argsort(senders, kind='stable')
+        times = times[order]
+        offsets = np.concatenate(([0], np.cumsum(counts)[:-1])) if len(counts) else counts
+        
+        # Calculate firing rates as spikes per second
+        duration_sec = (end_time - start_time) / 1000.0
+        rates = counts / duration_sec if duration_sec > 0 else np.zeros(len(counts))
+        firing_rates = {neuron_id: float(rate) for neuron_id, rate in zip(neuron_ids, rates)}
             
         # Calculate ISI histograms if requested
         isi_histograms = {}
         if 'isi' in metrics:
-            for neuron_id, spike_times in extracted_spikes.items():
-                if len(spike_times) >= 2:
-                    # Calculate inter-spike intervals
-                    isis = [spike_times[i+1] - spike_times[i] for i in range(len(spike_times)-1)]
+            # isis[i] is the interval between spikes i and i+1; intervals that
+            # cross a neuron boundary are never read below
+            isis = np.diff(times)
+            for k, neuron_id in enumerate(neuron_ids):
+                if counts[k] >= 2:
+                    neuron_isis = isis[offsets[k]:offsets[k] + counts[k] - 1]
                     
                     # Create histogram
-                    max_isi = max(isis) if isis else bin_size
+                    max_isi = neuron_isis.max()
                     bins = np.arange(0, max_isi + bin_size, bin_size)
-                    hist, edges = np.histogram(isis, bins=bins)
+                    hist, edges = np.histogram(neuron_isis, bins=bins)
                     
                     isi_histograms[neuron_id] = {
                         'counts': hist.tolist(),
                         'bin_edges': edges.tolist(),
-                        'mean_isi': np.mean(isis) if isis else 0,
-                        'std_isi': np.std(isis) if isis else 0
+                        'mean_isi': neuron_isis.mean(),
+                        'std_isi': neuron_isis.std()
                     }
                 else:
                     isi_histograms[neuron_id] = {
@@ -12,11 +12,6 @@ from neuroworkflow.core.port import PortType
 #%matplotlib inline
 # Import a bunch of stuff for TVB
 from tvb.simulator.lab import *
-from tvb.simulator.models.epileptor_rs import EpileptorRestingState
-from tvb.datatypes.time_series import TimeSeriesRegion
-import time as tm
-import matplotlib.pyplot as plt 
-import sys
 
 
 class TVBVisualizationNode(Node):
@@ -93,6 +88,9 @@ class TVBVisualizationNode(Node):
         Returns:
             Flag whether simulation was completed successfully
         """
+        # Imported here so loading the node does not pay matplotlib's start-up cost
+        import matplotlib.pyplot as plt
+
         tavg_data = data_series
         #print('data_series.shape: ',data_series.shape)
         tavg_time = time_series
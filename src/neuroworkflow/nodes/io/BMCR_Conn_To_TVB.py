@@ -88,6 +88,13 @@ class BMCR_Conn_To_TVB(Node):
                 constraints={'min': 0.1, 'max': 100.0},
                 optimizable=False
             ),
+            
+            'zip_compression': ParameterDefinition(
+                default_value='stored',
+                description='ZIP compression for the TVB package (stored skips deflate CPU cost, deflated gives smaller files)',
+                constraints={'allowed_values': ['stored', 'deflated']},
+                optimizable=False
+            ),
         },
         
         inputs={
@@ -323,7 +330,8 @@ class BMCR_Conn_To_TVB(Node):
         zip_file = subject_output_dir / f'connectivity_{subject_id}.zip'
         
         # Create ZIP file with all TVB format files
-        with zipfile.ZipFile(zip_file, 'w', zipfile.ZIP_DEFLATED) as zf:
+        compression = zipfile.ZIP_DEFLATED if self._parameters['zip_compression'] == 'deflated' else zipfile.ZIP_STORED
+        with zipfile.ZipFile(zip_file, 'w', compression) as zf:
             zf.write(tvb_files['weights'], 'weights.txt')
             zf.write(tvb_files['tract_lengths'], 'tract_lengths.txt')
             zf.write(tvb_files['centres'], 'centres.txt')
@@ -364,25 +372,22 @@ class BMCR_Conn_To_TVB(Node):
         
         try:
             # Try to create TVB Connectivity object
-            import tempfile
+            import io
             from tvb.datatypes.connectivity import Connectivity
             
-            with tempfile.TemporaryDirectory() as temp_dir:
-                # Extract ZIP to temp directory
-                with zipfile.ZipFile(tvb_zip_file, 'r') as zf:
-                    zf.extractall(temp_dir)
-                
+            # Read members straight from the ZIP instead of extracting to disk
+            with zipfile.ZipFile(tvb_zip_file, 'r') as zf:
                 # Load all TVB files
-                weights = np.loadtxt(Path(temp_dir) / 'weights.txt')
-                tract_lengths = np.loadtxt(Path(temp_dir) / 'tract_lengths.txt')
-                areas = np.loadtxt(Path(temp_dir) / 'areas.txt')
-                cortical = np.loadtxt(Path(temp_dir) / 'cortical.txt')
-                orientations = np.loadtxt(Path(temp_dir) / 'average_orientations.txt')
+                weights = np.loadtxt(zf.open('weights.txt'))
+                tract_lengths = np.loadtxt(zf.open('tract_lengths.txt'))
+                areas = np.loadtxt(zf.open('areas.txt'))
+                cortical = np.loadtxt(zf.open('cortical.txt'))
+                orientations = np.loadtxt(zf.open('average_orientations.txt'))
                 
                 # Load centres
                 centres_data = []
                 region_labels = []
-                with open(Path(temp_dir) / 'centres.txt', 'r') as f:
+                with io.TextIOWrapper(zf.open('centres.txt'), encoding='utf-8') as f:
                     for line in f:
                         parts = line.strip().split()
                         if len(parts) >= 4:
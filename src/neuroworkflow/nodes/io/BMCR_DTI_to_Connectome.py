@@ -10,9 +10,12 @@ Date: 2025-11-23
 Version: 1.0
 """
 
+import configparser
 import os
 import subprocess
+import tempfile
 import time
+from contextlib import contextmanager
 import numpy as np
 from typing import Dict, Any, Optional
 from pathlib import Path
@@ -41,6 +44,9 @@ class BMCR_DTI_to_Connectome(Node):
     about the processing, which can then be used by the BMCRToTVBNode for format conversion.
     """
     
+    # Relative runtime used for critical-path scheduling (S3 download + tck2connectome)
+    estimated_cost = 20.0
+    
     NODE_DEFINITION = NodeDefinitionSchema(
         type='bmcr_download',
         description='Downloads BMCR tractography data from AWS and generates connectome matrices using MRtrix3',
@@ -66,6 +72,20 @@ class BMCR_DTI_to_Connectome(Node):
                 constraints={},
                 optimizable=False
             ),
+            
+            's3_concurrency': ParameterDefinition(
+                default_value=16,
+                description='Number of concurrent ranged GET requests used by the AWS CLI per download',
+                constraints={'min': 1, 'max': 64},
+                optimizable=False
+            ),
+            
+            'part_size_mb': ParameterDefinition(
+                default_value=32,
+                description='Multipart chunk size in MB for S3 downloads',
+                constraints={'min': 5, 'max': 512},
+                optimizable=False
+            ),
         },
         
         inputs={
@@ -245,7 +265,9 @@ class BMCR_DTI_to_Connectome(Node):
             print(f"[{self.name}] Downloading {subject}.tck from AWS S3...")
             try:
                 cmd = ['aws', 's3', 'cp', s3_tracks_path, str(tracks_file), '--no-sign-request']
-                result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
+                with self._aws_transfer_env() as env:
+                    result = subprocess.run(cmd, capture_output=True, text=True, timeout=300,
+                                            env=env)
                 
                 if result.returncode == 0:
                     file_size = tracks_file.stat().st_size
@@ -282,6 +304,51 @@ class BMCR_DTI_to_Connectome(Node):
             'subject_id': subject
         }
     
+    @contextmanager
+    def _aws_transfer_env(self):
+        """Yield the environment for AWS CLI downloads with parallel ranged GETs.
+        
+        The AWS CLI splits large objects into multipart chunks and fetches them
+        concurrently; its transfer settings are only read from a config file.
+        The user's config (AWS_CONFIG_FILE or ~/.aws/config) is therefore copied
+        to a temporary file with the transfer settings merged into the active
+        profile's s3 block, so profiles, SSO, regions and credential_process
+        still apply. The temporary file is removed afterwards.
+        """
+        env = os.environ.copy()
+        user_config = Path(env.get('AWS_CONFIG_FILE') or Path.home() / '.aws' / 'config').expanduser()
+        config = configparser.RawConfigParser()
+        try:
+            config.read(user_config)
+        except configparser.Error as e:
+            print(f"[{self.name}] Using default S3 transfer settings, could not read {user_config}: {e}")
+            yield env
+            return
+        
+        profile = env.get('AWS_PROFILE') or env.get('AWS_DEFAULT_PROFILE') or 'default'
+        section = profile if profile == 'default' else f'profile {profile}'
+        if not config.has_section(section):
+            config.add_section(section)
+        
+        # Nested "s3 =" block: keep the user's other s3 settings
+        s3_settings = {}
+        for line in config.get(section, 's3', fallback='').splitlines():
+            key, sep, value = line.partition('=')
+            if sep:
+                s3_settings[key.strip()] = value.strip()
+        s3_settings['max_concurrent_requests'] = str(int(self._parameters['s3_concurrency']))
+        s3_settings['multipart_chunksize'] = f"{int(self._parameters['part_size_mb'])}MB"
+        config.set(section, 's3', ''.join(f"\n{key} = {value}" for key, value in s3_settings.items()))
+        
+        fd, config_file = tempfile.mkstemp(prefix='aws_s3_transfer_', suffix='.cfg')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                config.write(f)
+            env['AWS_CONFIG_FILE'] = config_file
+            yield env
+        finally:
+            os.unlink(config_file)
+    
     def generate_connectome(self, tracks_file: str) -> Dict[str, Any]:
         """Generate connectome matrix using MRtrix3."""
         print(f"[{self.name}] Generating connectome matrix...")
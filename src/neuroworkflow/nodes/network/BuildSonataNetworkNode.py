@@ -14,6 +14,16 @@ from neuroworkflow.core.port import PortType
 
 import nest 
 
+# h5py import (optional - used to align hyperslabs with on-disk HDF5 chunks)
+try:
+    import h5py
+    H5PY_AVAILABLE = True
+except ImportError:
+    H5PY_AVAILABLE = False
+
+# NEST's default number of edges read per hyperslab
+DEFAULT_HYPERSLAB_SIZE = 2**20
+
 
 class BuildSonataNetworkNode(Node):
     """SONATA Data loader and Network Building node."""
@@ -35,9 +45,9 @@ class BuildSonataNetworkNode(Node):
                 description='Simulation configuration file name'
             ),
             'hdf5_hyperslab_size': ParameterDefinition(
-                default_value=1,
-                description='Size of HDF5 hyperslab for efficient loading',
-                constraints={'min': 1}
+                default_value=0,
+                description='Minimum HDF5 hyperslab size in edges (0 = NEST default aligned to the edge files\' HDF5 chunks; smaller values are raised to that)',
+                constraints={'min': 0}
             ),
         },
         outputs={
@@ -134,6 +144,9 @@ class BuildSonataNetworkNode(Node):
         if not os.path.exists(sim_config_path):
             raise FileNotFoundError(f"Simulation config file not found: {sim_config_path}")
    
+        # Remember the edge files so the hyperslab size can be tuned to them
+        self._edge_files = self._resolve_edge_files(net_config_path)
+        
         # Create a SONATA network object
         sonata_net = nest.SonataNetwork(net_config_path, sim_config=sim_config_path)
 
@@ -142,9 +155,86 @@ class BuildSonataNetworkNode(Node):
     def build_network(self, sonata_net: Dict[str, Any]) -> Dict[str, Any]:
         """Build network in NEST."""
             
-        hdf5_hyperslab_size = self._parameters["hdf5_hyperslab_size"]
+        # A requested size never goes below the automatic one: small values
+        # (e.g. 1024 in older examples) would otherwise multiply the HDF5 reads
+        chunk = self._edge_chunk_size()
+        hdf5_hyperslab_size = self._auto_hyperslab_size(chunk)
+        requested = int(self._parameters["hdf5_hyperslab_size"] or 0)
+        if requested > hdf5_hyperslab_size:
+            step = chunk or 1
+            hdf5_hyperslab_size = -(-requested // step) * step
         print(f"Building network using hdf5_hyperslab_size = {hdf5_hyperslab_size}")
 
-        node_collections = sonata_net.BuildNetwork(hdf5_hyperslab_size=2**20)
+        node_collections = sonata_net.BuildNetwork(hdf5_hyperslab_size=hdf5_hyperslab_size)
+        
+        return {"node_collections": node_collections}
+    
+    def _resolve_edge_files(self, net_config_path: str) -> List[str]:
+        """Get the edge file paths from a SONATA circuit config.
+        
+        Args:
+            net_config_path: Path to the circuit configuration file
+            
+        Returns:
+            List of edge HDF5 file paths with manifest variables expanded
+        """
+        with open(net_config_path) as f:
+            config = json.load(f)
+        
+        manifest = dict(config.get("manifest", {}))
+        manifest.setdefault("${configdir}", os.path.dirname(os.path.abspath(net_config_path)))
+        
+        def expand(path: str) -> str:
+            # Manifest entries may refer to each other, so expand until stable
+            for _ in range(len(manifest) + 1):
+                expanded = path
+                for key, value in manifest.items():
+                    expanded = expanded.replace(key, value)
+                if expanded == path:
+                    break
+                path = expanded
+            return path
         
-        return {"node_collections": node_collections}
\ No newline at end of file
+        manifest = {key: expand(value) for key, value in manifest.items()}
+        return [expand(edges["edges_file"])
+                for edges in config.get("networks", {}).get("edges", [])
+                if "edges_file" in edges]
+    
+    def _edge_chunk_size(self) -> int:
+        """Get the largest HDF5 chunk length of the edge datasets.
+        
+        Returns:
+            Chunk length in edges, or 0 if h5py is not available or the edge
+            datasets are not chunked
+        """
+        if not H5PY_AVAILABLE:
+            return 0
+        
+        chunk = 0
+        for edge_file in getattr(self, "_edge_files", []):
+            try:
+                with h5py.File(edge_file, "r") as f:
+                    for population in f["edges"].values():
+                        dataset = population.get("source_node_id")
+                        if dataset is not None and dataset.chunks:
+                            chunk = max(chunk, dataset.chunks[0])
+            except (OSError, KeyError):
+                continue
+        return chunk
+    
+    def _auto_hyperslab_size(self, chunk: int) -> int:
+        """Choose a hyperslab size that is a multiple of the edge datasets' chunk size.
+        
+        Reading whole on-disk chunks avoids HDF5 decoding the same chunk for
+        two adjacent hyperslabs. Falls back to NEST's default if the edge
+        datasets are not chunked.
+        
+        Args:
+            chunk: Edge dataset chunk length (see _edge_chunk_size)
+        
+        Returns:
+            Number of edges read per hyperslab
+        """
+        if not chunk:
+            return DEFAULT_HYPERSLAB_SIZE
+        return max(chunk, (DEFAULT_HYPERSLAB_SIZE // chunk) * chunk)
\ No newline at end of file
@@ -4,6 +4,11 @@ the set of all existing anatomical connections between brain areas in the virtua
 """
 
 from typing import Dict, Any, Optional
+from collections import OrderedDict
+import hashlib
+import os
+import tempfile
+import threading
 import numpy as np
 
 from neuroworkflow.core.node import Node
@@ -13,12 +18,12 @@ from neuroworkflow.core.port import PortType
 #%matplotlib inline
 # Import a bunch of stuff for TVB
 from tvb.simulator.lab import *
-from tvb.simulator.models.epileptor_rs import EpileptorRestingState
-from tvb.datatypes.time_series import TimeSeriesRegion
-import time as tm
-import matplotlib.pyplot as plt 
 import sys
 
+# Connectivity fields read from the ZIP that are worth caching
+CACHED_FIELDS = ('weights', 'tract_lengths', 'centres', 'region_labels',
+                 'orientations', 'areas', 'cortical', 'hemispheres')
+
 
 class TVBConnectivitySetUpNode(Node):
     """Node for loading and visualizing the structural connectivity matrix that represents the set of all existing anatomical connections between brain areas"""
@@ -35,6 +40,13 @@ class TVBConnectivitySetUpNode(Node):
                 optimizable=False,
                 optimization_range=[]
             ),
+            'cache_dir': ParameterDefinition(
+                default_value='~/.cache/neuroworkflow/conn',
+                description='Directory for parsed connectivity arrays keyed by ZIP content hash (empty to disable)',
+                constraints={},
+                optimizable=False,
+                optimization_range=[]
+            ),
         },
         
         inputs={
@@ -64,6 +76,14 @@ class TVBConnectivitySetUpNode(Node):
             )
         }
     )
+    
+    # Parsed connectivity arrays shared across node instances in this process
+    # (read-only copies, least recently used evicted first); guarded by
+    # _memory_cache_lock since nodes may run in parallel threads
+    _memory_cache: "OrderedDict[str, Dict[str, np.ndarray]]" = OrderedDict()
+    _memory_cache_lock = threading.Lock()
+    MEMORY_CACHE_MAXSIZE = 8
+    
     def __init__(self, name: str):
         """Initialize the TVBConnectivitySetUpNode.
         
@@ -103,7 +123,7 @@ class TVBConnectivitySetUpNode(Node):
             file_path = self._parameters['connectivity_file']
             print(f"[{self.name}] Using connectivity file from parameter: {file_path}")
             
-        con = connectivity.Connectivity.from_file(file_path)      
+        con = self._load_connectivity(file_path)
         nregions = len(con.region_labels)                               #number of regions
         con.weights = con.weights - con.weights * np.eye((nregions))    #remove self-connection
         con.speed = np.array([sys.float_info.max])                      #set conduction speed (here we neglect it)
@@ -112,6 +132,82 @@ class TVBConnectivitySetUpNode(Node):
             'tvb_connectivity': con,
         }
 
+    def _load_connectivity(self, file_path: str) -> Any:
+        """Load a connectivity ZIP, reusing previously parsed arrays.
+        
+        Parsing the text matrices in the ZIP dominates load time, so the
+        parsed arrays are cached in memory and as an uncompressed .npz under
+        cache_dir, keyed by the SHA-256 of the ZIP contents. A fresh
+        Connectivity object is built on every call so callers may modify it.
+        
+        Args:
+            file_path: Path to the TVB connectivity ZIP file
+            
+        Returns:
+            Connectivity object (not yet configured)
+        """
+        if not os.path.isfile(file_path):
+            # Let TVB resolve bundled data set names such as 'connectivity_76.zip'
+            return connectivity.Connectivity.from_file(file_path)
+        
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+        key = digest.hexdigest()
+        
+        with self._memory_cache_lock:
+            fields = self._memory_cache.get(key)
+        cache_dir = self._parameters['cache_dir']
+        cache_path = os.path.join(os.path.expanduser(cache_dir), f"{key}.npz") if cache_dir else None
+        
+        if fields is None and cache_path and os.path.exists(cache_path):
+            try:
+                with np.load(cache_path, allow_pickle=False) as npz:
+                    fields = {name: npz[name] for name in npz.files}
+                print(f"[{self.name}] Loaded cached connectivity arrays: {cache_path}")
+            except (OSError, ValueError) as e:
+                print(f"[{self.name}] Ignoring unreadable connectivity cache {cache_path}: {e}")
+        
+        if fields is None:
+            con = connectivity.Connectivity.from_file(file_path)
+            # Copies: the caller (and later steps) may modify con's arrays in place
+            fields = {name: np.array(getattr(con, name)) for name in CACHED_FIELDS
+                      if getattr(con, name, None) is not None}
+            if cache_path:
+                self._write_cache(cache_path, fields)
+            self._remember(key, fields)
+            return con
+        
+        self._remember(key, fields)
+        return connectivity.Connectivity(**{name: value.copy() for name, value in fields.items()})
+    
+    @classmethod
+    def _remember(cls, key: str, fields: Dict[str, np.ndarray]) -> None:
+        """Keep parsed arrays in the bounded in-memory cache, marked read-only."""
+        for value in fields.values():
+            value.setflags(write=False)
+        with cls._memory_cache_lock:
+            cls._memory_cache[key] = fields
+            cls._memory_cache.move_to_end(key)
+            while len(cls._memory_cache) > cls.MEMORY_CACHE_MAXSIZE:
+                cls._memory_cache.popitem(last=False)
+    
+    def _write_cache(self, cache_path: str, fields: Dict[str, np.ndarray]) -> None:
+        """Atomically write connectivity arrays to an .npz cache file."""
+        tmp_path = None
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path), suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                np.savez(f, **fields)
+            os.replace(tmp_path, cache_path)
+            tmp_path = None
+        except OSError as e:
+            print(f"[{self.name}] Could not write connectivity cache {cache_path}: {e}")
+        finally:
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
     
     def sc_visualization(self, tvb_connectivity: Dict[str, Any]) -> Dict[str, Any]:
         """Visualize connectivity matrix object in TVB format.
@@ -122,6 +218,8 @@ class TVBConnectivitySetUpNode(Node):
         Returns:
             a flag indicating the visualization is completed
         """
+        # Imported here so loading the node does not pay matplotlib's start-up cost
+        import matplotlib.pyplot as plt
         
         # Visualization.
         plt.figure(figsize=(12,12))
@@ -12,11 +12,6 @@ from neuroworkflow.core.port import PortType
 #%matplotlib inline
 # Import a bunch of stuff for TVB
 from tvb.simulator.lab import *
-from tvb.simulator.models.epileptor_rs import EpileptorRestingState
-from tvb.datatypes.time_series import TimeSeriesRegion
-import time as tm
-import matplotlib.pyplot as plt 
-import sys
 
 
 class TVBIntegratorNode(Node):
@@ -6,6 +6,7 @@ and optimizing their parameters jointly.
 """
 
 from typing import Dict, Any, List, Callable, Optional
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
 from itertools import product
 
@@ -36,6 +37,11 @@ class JointOptimizationNode(Node):
                 default_value=100,
                 description='Maximum number of iterations',
                 constraints={'min': 1}
+            ),
+            'n_workers': ParameterDefinition(
+                default_value=1,
+                description='Number of worker processes used by run_grid_search',
+                constraints={'min': 1}
             )
         },
         
@@ -85,6 +91,13 @@ class JointOptimizationNode(Node):
                 description='Suggest parameters for next iteration',
                 inputs=['evaluation_result', 'parameter_metadata'],
                 outputs=['parameters']
+            ),
+            # Called directly with a simulation function rather than as a
+            # process step, since it runs the simulations itself
+            'run_grid_search': MethodDefinition(
+                description='Evaluate the whole parameter grid with a simulation function',
+                inputs=['parameter_metadata', 'objective_target'],
+                outputs=[]
             )
         }
     )
@@ -98,6 +111,11 @@ class JointOptimizationNode(Node):
         super().__init__(name)
         self._define_process_steps()
         self._optimization_history = []
+        # Column-wise copies of the history for plotting/analysis without
+        # per-entry dict lookups
+        self._history_iterations = []
+        self._history_errors = []
+        self._history_spike_counts = []
         self._best_error = float('inf')
         self._best_params = {}
         self._best_simulation = None
@@ -156,7 +174,7 @@ class JointOptimizationNode(Node):
         }
         
         # Update optimization history
-        self._optimization_history.append(evaluation_result)
+        self._record_evaluation(evaluation_result)
         
         # Update best result if better
         if error < self._best_error:
@@ -253,6 +271,89 @@ class JointOptimizationNode(Node):
             'parameters': next_params_by_node
         }
     
+    def run_grid_search(self, simulate: Callable[[Dict[str, Dict[str, Any]]], Dict[str, Any]],
+                        parameter_metadata: Dict[str, Any], objective_target: float,
+                        initial_parameters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Evaluate the whole parameter grid at once instead of one point per iteration.
+        
+        All grid combinations are enumerated up-front and passed to simulate,
+        concurrently on n_workers processes when n_workers > 1. simulate must be
+        a picklable (module-level) function that takes parameters grouped by
+        node and returns simulation results with 'spike_count' or 'spike_times'.
+        Each worker process has its own simulator kernel, so simulate should
+        build and run the model from scratch.
+        
+        Args:
+            simulate: Function mapping grouped parameters to simulation results
+            parameter_metadata: Optimization metadata from the parameter nodes
+            objective_target: Target spike count
+            initial_parameters: Current values by full parameter name (node.param),
+                used when a parameter has no optimization range
+            
+        Returns:
+            Optimization results (see get_optimization_results), with an
+            'error' message instead of running anything when the grid is empty
+        """
+        optimizable_params = {}
+        for node_name, node_metadata in (parameter_metadata or {}).items():
+            for param_name, param_info in node_metadata.items():
+                if not param_info.get('optimizable', False):
+                    continue
+                full_param_name = f"{node_name}.{param_name}"
+                current_value = (initial_parameters or {}).get(full_param_name)
+                param_range = param_info.get('range', [])
+                # Without a range the grid is built around the current value
+                if current_value is None and len(param_range) != 2:
+                    continue
+                self._param_sources[full_param_name] = node_name
+                optimizable_params[full_param_name] = {
+                    'current_value': current_value,
+                    'range': param_range,
+                    'constraints': param_info.get('constraints', {})
+                }
+        
+        if not optimizable_params:
+            return {**self.get_optimization_results(),
+                    'error': 'No optimizable parameters to build a grid from'}
+        
+        self._create_grid_search(optimizable_params)
+        param_names = list(self._param_grid.keys())
+        candidates = [dict(zip(param_names, combination)) for combination in self._param_combinations]
+        grouped = [self._group_parameters_by_node(flat) for flat in candidates]
+        
+        n_workers = self._parameters['n_workers']
+        if n_workers > 1:
+            with ProcessPoolExecutor(max_workers=n_workers) as executor:
+                all_results = list(executor.map(simulate, grouped))
+        else:
+            all_results = [simulate(params) for params in grouped]
+        
+        # Spike-count errors for the whole grid in one vectorized step
+        spike_counts = np.array([
+            results.get('spike_count') or len(results.get('spike_times', []))
+            for results in all_results
+        ])
+        errors = np.abs(spike_counts - objective_target)
+        
+        for iteration, (flat, results, error) in enumerate(zip(candidates, all_results, errors)):
+            self._record_evaluation({
+                'iteration': iteration,
+                'parameters': flat,
+                'error': float(error),
+                'spike_count': int(spike_counts[iteration]),
+                'objective_target': objective_target
+            })
+        
+        best = int(np.argmin(errors))
+        if errors[best] < self._best_error:
+            self._best_error = float(errors[best])
+            self._best_params = candidates[best].copy()
+            self._best_simulation = all_results[best]
+        self._current_combination = len(self._param_combinations)
+        
+        print(f"Grid search complete - best error {self._best_error}")
+        return self.get_optimization_results()
+    
     def _create_grid_search(self, optimizable_params: Dict[str, Dict[str, Any]]) -> None:
         """Create a grid search for the given optimizable parameters.
         
@@ -365,22 +466,41 @@ class JointOptimizationNode(Node):
         
         return params_by_node
     
+    def _record_evaluation(self, evaluation_result: Dict[str, Any]) -> None:
+        """Append an evaluation to the history and its per-column arrays.
+        
+        Args:
+            evaluation_result: Evaluation entry with iteration, error and spike_count
+        """
+        self._optimization_history.append(evaluation_result)
+        self._history_iterations.append(evaluation_result['iteration'])
+        self._history_errors.append(evaluation_result['error'])
+        self._history_spike_counts.append(evaluation_result['spike_count'])
+    
     def get_optimization_results(self) -> Dict[str, Any]:
         """Get the current optimization results.
         
         Returns:
-            Dictionary with optimization results
+            Dictionary with optimization results. 'history' is the list of
+            evaluation entries; 'iterations', 'errors' and 'spike_counts' hold
+            the same values as NumPy arrays, one element per evaluation.
         """
         return {
             'best_parameters': self._best_params,
             'best_error': self._best_error,
             'best_simulation': self._best_simulation,
-            'history': self._optimization_history
+            'history': self._optimization_history,
+            'iterations': np.asarray(self._history_iterations, dtype=np.int64),
+            'errors': np.asarray(self._history_errors, dtype=np.float64),
+            'spike_counts': np.asarray(self._history_spike_counts, dtype=np.int64)
         }
     
     def reset_optimization(self) -> None:
         """Reset the optimization state."""
         self._optimization_history = []
+        self._history_iterations = []
+        self._history_errors = []
+        self._history_spike_counts = []
         self._best_error = float('inf')
         self._best_params = {}
         self._best_simulation = None
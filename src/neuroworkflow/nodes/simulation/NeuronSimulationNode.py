@@ -85,6 +85,11 @@ class NeuronSimulationNode(Node):
             name: Name of the node
         """
         super().__init__(name)
+        # Recording devices reused while (dt, simulation_time, neuron) are unchanged
+        self._recorder_key = None
+        self._multimeter = None
+        self._spike_recorder = None
+        self._recorder_kernel_state = None
         self._define_process_steps()
     
     def _define_process_steps(self) -> None:
@@ -122,14 +127,8 @@ class NeuronSimulationNode(Node):
         # Apply stimuli
         #nest.Connect(input_current, nest_neuron)
 
-        # Create devices for recordings
-        # Multimeter
-        mul = nest.Create("multimeter", params={"interval": dt, "record_from": ["V_m"]})
-        nest.Connect(mul, nest_neuron)
-        
-        # Spike recorder
-        spr = nest.Create("spike_recorder")
-        nest.Connect(nest_neuron, spr)
+        # Create (or reuse) devices for recordings
+        mul, spr = self._get_recorders(nest_neuron, dt, simulation_time)
         
         # Simulate using the neuron model object
         nest.Simulate(simulation_time)
@@ -153,4 +152,57 @@ class NeuronSimulationNode(Node):
             'spike_times': spike_times,
             'time': times,
             'simulation_results': simulation_results
-        }
\ No newline at end of file
+        }
+    
+    def _get_recorders(self, nest_neuron: Any, dt: float, simulation_time: float):
+        """Return a multimeter and spike recorder connected to the neuron.
+        
+        When dt, simulation_time and the neuron are unchanged and the devices
+        belong to the current NEST kernel (no ResetKernel in between), the devices
+        from the previous call are reused with their events cleared instead of
+        adding two new devices and connections to the network on every run.
+        
+        Args:
+            nest_neuron: Neuron model object to record from
+            dt: Recording interval (ms)
+            simulation_time: Simulation time (ms)
+            
+        Returns:
+            Tuple of (multimeter, spike_recorder)
+        """
+        key = (dt, simulation_time, tuple(nest_neuron.tolist()))
+        if key == self._recorder_key:
+            try:
+                # After nest.ResetKernel() the network size and clock restart,
+                # and the old handles may point at other devices
+                network_size, biological_time = self._kernel_state()
+                created_size, created_time = self._recorder_kernel_state
+                if (network_size >= created_size and biological_time >= created_time
+                        and self._multimeter.get('model') == 'multimeter'
+                        and self._spike_recorder.get('model') == 'spike_recorder'):
+                    self._multimeter.n_events = 0
+                    self._spike_recorder.n_events = 0
+                    self._recorder_kernel_state = (created_size, biological_time)
+                    return self._multimeter, self._spike_recorder
+            except Exception:
+                pass
+        
+        # Multimeter
+        mul = nest.Create("multimeter", params={"interval": dt, "record_from": ["V_m"]})
+        nest.Connect(mul, nest_neuron)
+        
+        # Spike recorder
+        spr = nest.Create("spike_recorder")
+        nest.Connect(nest_neuron, spr)
+        
+        self._recorder_key = key
+        self._multimeter = mul
+        self._spike_recorder = spr
+        self._recorder_kernel_state = self._kernel_state()
+        return mul, spr
+    
+    @staticmethod
+    def _kernel_state() -> tuple:
+        """Return the NEST (network_size, biological_time) kernel status."""
+        status = nest.GetKernelStatus(['network_size', 'biological_time'])
+        return status[0], status[1]
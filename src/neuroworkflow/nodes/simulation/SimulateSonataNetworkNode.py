@@ -17,6 +17,9 @@ import nest
 class SimulateSonataNetworkNode(Node):
     """Simulation of a NEST network built from SONATA."""
     
+    # Relative runtime used for critical-path scheduling (simulation dominates)
+    estimated_cost = 50.0
+    
     NODE_DEFINITION = NodeDefinitionSchema(
         type='simulation_node',
         description='Simulates a NEST network built from SONATA',
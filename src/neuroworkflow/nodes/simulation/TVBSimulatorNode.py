@@ -12,16 +12,15 @@ from neuroworkflow.core.port import PortType
 #%matplotlib inline
 # Import a bunch of stuff for TVB
 from tvb.simulator.lab import *
-from tvb.simulator.models.epileptor_rs import EpileptorRestingState
-from tvb.datatypes.time_series import TimeSeriesRegion
 import time as tm
-import matplotlib.pyplot as plt 
-import sys
 
 
 class TVBSimulatorNode(Node):
     """Node for defining and running the simulation."""
     
+    # Relative runtime used for critical-path scheduling (simulation dominates)
+    estimated_cost = 50.0
+    
     NODE_DEFINITION = NodeDefinitionSchema(
         type='simulation_node',
         description='Definition and execution of the simulation',
@@ -7,6 +7,7 @@ This module provides nodes for simulating Virtual Neuromodulation (Group Surroga
 from typing import Dict, Any, List, Tuple, Optional
 import time
 import os
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
 import h5py
 import hdf5storage
@@ -18,6 +19,68 @@ from neuroworkflow.core.schema import NodeDefinitionSchema, PortDefinition, Para
 from neuroworkflow.core.port import PortType
 
 
+# Per-process simulation inputs, set once by _init_trial_worker so that
+# CX and the model are pickled once per worker instead of once per trial
+_TRIAL_INPUTS: Dict[str, Any] = {}
+
+
+def _init_trial_worker(inputs: Dict[str, Any]) -> None:
+    """Store shared simulation inputs in a trial worker process."""
+    _TRIAL_INPUTS.update(inputs)
+    # Forked workers inherit the parent's RNG state; reseed so trials that
+    # generate new permutations/surrogates do not repeat each other
+    np.random.seed()
+
+
+def _run_trial(i: int) -> List[List[Any]]:
+    """Run one virtual neuromodulation trial (all target ROIs).
+    
+    Args:
+        i: Zero-based trial index
+        
+    Returns:
+        List of [surrogate time-series, roi] pairs, one per target ROI
+    """
+    CX = _TRIAL_INPUTS['CX']
+    simulation_name = _TRIAL_INPUTS['simulation_name']
+    subject_perm_path = _TRIAL_INPUTS['subject_perm_path']
+    n_surr = _TRIAL_INPUTS['n_surr']
+    srframes = _TRIAL_INPUTS['srframes']
+    trois = _TRIAL_INPUTS['trois']
+
+    perm = []
+    permf = subject_perm_path + '/perm' + str(i + 1) + '_' + simulation_name + '.mat'
+    if os.path.isfile(permf):
+        print('loading subject permutation : ' + permf)
+        dic = h5py.File(permf, 'r')
+        perm = np.array(dic['perm']).T[0]  # Dataset to single array 1xlength
+        perm = perm.astype(np.int32)
+        dic.close()
+
+    if len(perm) == 0 or perm is None:
+        # generate subject permutation
+        permf = subject_perm_path + '/perm' + str(i + 1) + '_' + simulation_name + '.mat'
+        perm, uxtime = vnm.vnm_subject_perm(CX)
+        matdata = {}
+        matdata['perm'] = perm
+        matdata['uxtime'] = uxtime
+        hdf5storage.write(matdata, filename=permf, matlab_compatible=True)
+        print('save perm file : ' + permf)
+
+    # loop for neuromodulation target rois
+    S_rois = [None] * len(trois)
+    for j in range(len(trois)):
+        roi = trois[j]
+
+        # calc virtual neuromodulation VAR surrogate
+        print('calc virtual neuromodulation surrogate. roi=' +str(roi)+ ', n_surr=' +str(n_surr))
+        S = vnm.vnm_var_surrogate(_TRIAL_INPUTS['model'], CX, _TRIAL_INPUTS['CAs'][j],
+                                  _TRIAL_INPUTS['CMs'][j], perm, n_surr, srframes)
+        S_rois[j] = [S, roi]
+
+    return S_rois
+
+
 class VNMSimulatorNode(Node):
     """Simulation of a Virtual Neuromodulation (Group Surrogate model)."""
     
@@ -49,6 +112,10 @@ class VNMSimulatorNode(Node):
                 default_value='40',
                 description='Number of surrogates time-series in each trial (Fixed value)',
             ),
+            'n_workers':ParameterDefinition(
+                default_value='1',
+                description='Number of worker processes running trials in parallel (0 = one per CPU, up to the number of trials)',
+            ),
             'modulation_params': ParameterDefinition(
                 default_value='28,22,160,0.15',
                 description='Virtual neuromodulation params: on/off/total duration (sec), and modulation power (Fixed value)',
@@ -209,41 +276,29 @@ class VNMSimulatorNode(Node):
         trois = self.str2numlist(self._parameters['target_ROI'], int)
         srframes = int(vnpm[2])
 
-        trials = [None] * n_trials
-
-        # process each file
-        for i in range(n_trials):
-            perm = []
-            permf = subject_perm_path + '/perm' + str(i + 1) + '_' + simulation_name + '.mat'
-            if os.path.isfile(permf):
-                print('loading subject permutation : ' + permf)
-                dic = h5py.File(permf, 'r')
-                perm = np.array(dic['perm']).T[0]  # Dataset to single array 1xlength
-                perm = perm.astype(np.int32)
-                dic.close()
-
-            if len(perm) == 0 or perm is None:
-                # generate subject permutation
-                permf = subject_perm_path + '/perm' + str(i + 1) + '_' + simulation_name + '.mat'
-                perm, uxtime = vnm.vnm_subject_perm(CX)
-                matdata = {}
-                matdata['perm'] = perm
-                matdata['uxtime'] = uxtime
-                hdf5storage.write(matdata, filename=permf, matlab_compatible=True)
-                print('save perm file : ' + permf)
-
-            # loop for neuromodulation target rois
-            S_rois = [None] * len(trois)
-            for j in range(len(trois)):
-                roi = trois[j]
-                sessionName = simulation_name+ '_' +str(roi)+ 'sr' +str(n_surr)+ 'pr' +str(i+1)
-
-                # calc virtual neuromodulation VAR surrogate
-                print('calc virtual neuromodulation surrogate. roi=' +str(roi)+ ', n_surr=' +str(n_surr))
-                S = vnm.vnm_var_surrogate(model, CX, CAs[j], CMs[j], perm, n_surr, srframes)
-                S_rois[j] = [S, roi]
-
-            trials[i] = S_rois
+        n_workers = int(self._parameters['n_workers'])
+        if n_workers <= 0:
+            n_workers = os.cpu_count() or 1
+        n_workers = min(n_workers, n_trials)
+
+        inputs = {
+            'CX': CX, 'model': model, 'CAs': CAs, 'CMs': CMs,
+            'simulation_name': simulation_name, 'subject_perm_path': subject_perm_path,
+            'n_surr': n_surr, 'srframes': srframes, 'trois': trois,
+        }
+
+        # Trials are independent, so they can run on separate processes
+        if n_workers > 1:
+            print(f"Running {n_trials} trials on {n_workers} worker processes")
+            with ProcessPoolExecutor(max_workers=n_workers, initializer=_init_trial_worker,
+                                     initargs=(inputs,)) as executor:
+                trials = list(executor.map(_run_trial, range(n_trials)))
+        else:
+            _TRIAL_INPUTS.update(inputs)
+            try:
+                trials = [_run_trial(i) for i in range(n_trials)]
+            finally:
+                _TRIAL_INPUTS.clear()
 
         return {"simulation_name": simulation_name, "trials": trials, "Chrf": Chrf}
     
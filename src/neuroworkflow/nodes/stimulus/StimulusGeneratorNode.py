@@ -108,6 +108,10 @@ class StimulusGeneratorNode(Node):
             name: Name of the node
         """
         super().__init__(name)
+        # NEST generator reused across calls while the device model is unchanged
+        self._stimulus_device = None
+        self._stimulus_model = None
+        self._stimulus_kernel_state = None
         self._define_process_steps()
     
     def _define_process_steps(self) -> None:
@@ -150,38 +154,33 @@ class StimulusGeneratorNode(Node):
         frequency = self._parameters['frequency']
         noise_sigma = self._parameters['noise_sigma']
         
-        # Generate stimulus based on type in nest
-        if stimulus_type == 'step':
-            input_current = nest.Create("step_current_generator", params={
-                "amplitude_values": [amplitude],
-                "amplitude_times": [start_time],
-                "start": start_time,
-                "stop": end_time,
-            })
-        elif stimulus_type == 'sine':
+        # NEST device model and parameters for each stimulus type
+        if stimulus_type == 'sine':
             # Create sine wave stimulus
-            input_current = nest.Create("ac_generator", params={
+            model, params = "ac_generator", {
                 "amplitude": amplitude,
                 "frequency": frequency,
                 "start": start_time,
                 "stop": end_time
-            })
+            }
         elif stimulus_type == 'noise':
             # Create noise stimulus
-            input_current = nest.Create("noise_generator", params={
+            model, params = "noise_generator", {
                 "mean": amplitude,
                 "std": noise_sigma,
                 "start": start_time,
                 "stop": end_time
-            })
+            }
         else:
-            # Default to step current
-            input_current = nest.Create("step_current_generator", params={
+            # Step current (also the default)
+            model, params = "step_current_generator", {
                 "amplitude_values": [amplitude],
                 "amplitude_times": [start_time],
                 "start": start_time,
                 "stop": end_time,
-            })
+            }
+        
+        input_current = self._get_stimulus_device(model, params)
         
         # Get optimization metadata
         optimization_metadata = self.get_optimizable_parameters()
@@ -191,4 +190,46 @@ class StimulusGeneratorNode(Node):
         return {
             'input_current': input_current,
             'parameter_metadata': {self.name: optimization_metadata}
-        }
\ No newline at end of file
+        }
+    
+    def _get_stimulus_device(self, model: str, params: Dict[str, Any]) -> Any:
+        """Return a NEST generator of the given model configured with params.
+        
+        Repeated calls (e.g. from an optimization loop) update the existing
+        device in place instead of adding a new device to the NEST network
+        on every iteration. A new device is created if the model changed or
+        the kernel was reset since the device was created (detected by the
+        network size or simulation time going backwards).
+        
+        Args:
+            model: NEST device model name
+            params: Device parameters
+            
+        Returns:
+            NEST NodeCollection of the generator
+        """
+        if self._stimulus_device is not None and self._stimulus_model == model:
+            try:
+                # Within one kernel neither the network nor the clock shrinks;
+                # after nest.ResetKernel() the old handle may point at another
+                # device of the same model, so it must not be reused
+                network_size, biological_time = self._kernel_state()
+                created_size, created_time = self._stimulus_kernel_state
+                if (network_size >= created_size and biological_time >= created_time
+                        and self._stimulus_device.get('model') == model):
+                    self._stimulus_device.set(params)
+                    self._stimulus_kernel_state = (created_size, biological_time)
+                    return self._stimulus_device
+            except Exception:
+                pass
+        
+        self._stimulus_device = nest.Create(model, params=params)
+        self._stimulus_model = model
+        self._stimulus_kernel_state = self._kernel_state()
+        return self._stimulus_device
+    
+    @staticmethod
+    def _kernel_state() -> tuple:
+        """Return the NEST (network_size, biological_time) kernel status."""
+        status = nest.GetKernelStatus(['network_size', 'biological_time'])
+        return status[0], status[1]